@@ -1,9 +1,9 @@
 import stactools.core
 from stactools.cli.registry import Registry
 from stactools.glad_glclu2020.metadata import CollectionIDs
-from stactools.glad_glclu2020.stac import create_collection, create_item
+from stactools.glad_glclu2020.stac import create_collection, create_item, create_items
 
-__all__ = ["create_collection", "create_item", "CollectionIDs"]
+__all__ = ["create_collection", "create_item", "create_items", "CollectionIDs"]
 
 stactools.core.use_fsspec()
 
@@ -1,4 +1,5 @@
 import logging
+import os
 import warnings
 from typing import Optional
 
@@ -6,6 +7,7 @@ import click
 from click import Command, Group
 from pystac import MediaType
 
+from stactools.core.io import read_text
 from stactools.glad_glclu2020 import stac
 from stactools.glad_glclu2020.metadata import (
     DEFAULT_HREF_FORMAT,
@@ -41,7 +43,9 @@ def create_gladglclu2020_command(cli: Group) -> Command:
     )
     @click.option(
         "--media-type",
-        type=str,
+        type=click.Choice(
+            [MediaType.COG.value, MediaType.GEOTIFF.value], case_sensitive=False
+        ),
         help="Media type for the collection",
         default=None,
     )
@@ -52,11 +56,19 @@ def create_gladglclu2020_command(cli: Group) -> Command:
         "the assets",
         default=None,
     )
+    @click.option(
+        "--strict-media-type",
+        is_flag=True,
+        help="Run the full COG validation on the sample asset instead of identifying "
+        "COGs from the raster header",
+        default=False,
+    )
     def create_collection_command(
         destination: str,
         collection_type: str,
         media_type: Optional[str],
         sample_asset_href: Optional[str],
+        strict_media_type: bool,
     ) -> None:
         """Creates a STAC Collection
 
@@ -65,6 +77,7 @@ def create_gladglclu2020_command(cli: Group) -> Command:
             id: Collection ID to create
             media_type: Media type for the collection
             sample_asset_href: Sample asset HREF for the collection
+            strict_media_type: Fully validate the sample asset as a COG
         """
         collection_id = (
             CollectionIDs.GLAD_GLCLU2020
@@ -86,6 +99,7 @@ def create_gladglclu2020_command(cli: Group) -> Command:
             id=collection_id,
             media_type=media_type_enum,
             sample_asset_href=sample_asset_href,
+            strict_media_type=strict_media_type,
         )
         collection.set_self_href(destination)
         collection.save_object()
@@ -121,4 +135,38 @@ def create_gladglclu2020_command(cli: Group) -> Command:
         )
         item.save_object(dest_href=destination)
 
+    @gladglclu2020.command(
+        "create-items",
+        help=stac.CREATE_ITEMS_DESCRIPTION,
+        short_help="Create STAC items from a list of asset hrefs",
+    )
+    @click.argument("sources")
+    @click.argument("destination")
+    @click.option(
+        "--href-format",
+        type=str,
+        help=stac.CREATE_ITEM_DESCRIPTION,
+        default=DEFAULT_HREF_FORMAT,
+    )
+    def create_items_command(
+        sources: str,
+        destination: str,
+        href_format: str,
+    ) -> None:
+        """Creates STAC Items from a list of asset HREFs
+
+        Args:
+            sources: HREF of a text file listing one Asset HREF per line
+            destination: A directory for the STAC Items
+            href_format: Format for asset HREFs
+        """
+        asset_hrefs = [
+            line.strip() for line in read_text(sources).splitlines() if line.strip()
+        ]
+        for item in stac.create_items(
+            asset_hrefs=asset_hrefs,
+            href_format=href_format,
+        ):
+            item.save_object(dest_href=os.path.join(destination, f"{item.id}.json"))
+
     return gladglclu2020
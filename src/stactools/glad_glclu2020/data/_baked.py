@@ -0,0 +1,2617 @@
+"""Classification data baked from the CSV files in this directory.
+
+Generated by scripts/bake-classifications, do not edit by hand.
+"""
+
+from typing import List, Optional, Tuple
+
+# (value, name, description, nodata, color_hint, rgb)
+ClassificationRow = Tuple[
+    int, str, str, bool, Optional[str], Optional[Tuple[int, int, int]]
+]
+
+ANNUAL: List[ClassificationRow] = [
+    (
+        0,
+        "terra-firma-true-desert-3-short-vegetation-cover",
+        "True desert - 3% short vegetation cover",
+        False,
+        "FEFECC",
+        (254, 254, 204),
+    ),
+    (
+        1,
+        "terra-firma-true-desert-7-short-vegetation-cover",
+        "True desert - 7% short vegetation cover",
+        False,
+        "FAFAC3",
+        (250, 250, 195),
+    ),
+    (
+        2,
+        "terra-firma-semi-arid-11-short-vegetation-cover",
+        "Semi-arid - 11% short vegetation cover",
+        False,
+        "F7F7BB",
+        (247, 247, 187),
+    ),
+    (
+        3,
+        "terra-firma-semi-arid-15-short-vegetation-cover",
+        "Semi-arid - 15% short vegetation cover",
+        False,
+        "F4F4B3",
+        (244, 244, 179),
+    ),
+    (
+        4,
+        "terra-firma-semi-arid-19-short-vegetation-cover",
+        "Semi-arid - 19% short vegetation cover",
+        False,
+        "F1F1AB",
+        (241, 241, 171),
+    ),
+    (
+        5,
+        "terra-firma-semi-arid-23-short-vegetation-cover",
+        "Semi-arid - 23% short vegetation cover",
+        False,
+        "EDEDA2",
+        (237, 237, 162),
+    ),
+    (
+        6,
+        "terra-firma-semi-arid-27-short-vegetation-cover",
+        "Semi-arid - 27% short vegetation cover",
+        False,
+        "EAEA9A",
+        (234, 234, 154),
+    ),
+    (
+        7,
+        "terra-firma-semi-arid-31-short-vegetation-cover",
+        "Semi-arid - 31% short vegetation cover",
+        False,
+        "E7E792",
+        (231, 231, 146),
+    ),
+    (
+        8,
+        "terra-firma-semi-arid-35-short-vegetation-cover",
+        "Semi-arid - 35% short vegetation cover",
+        False,
+        "E4E48A",
+        (228, 228, 138),
+    ),
+    (
+        9,
+        "terra-firma-semi-arid-39-short-vegetation-cover",
+        "Semi-arid - 39% short vegetation cover",
+        False,
+        "E0E081",
+        (224, 224, 129),
+    ),
+    (
+        10,
+        "terra-firma-semi-arid-43-short-vegetation-cover",
+        "Semi-arid - 43% short vegetation cover",
+        False,
+        "DDDD79",
+        (221, 221, 121),
+    ),
+    (
+        11,
+        "terra-firma-semi-arid-47-short-vegetation-cover",
+        "Semi-arid - 47% short vegetation cover",
+        False,
+        "DADA71",
+        (218, 218, 113),
+    ),
+    (
+        12,
+        "terra-firma-semi-arid-51-short-vegetation-cover",
+        "Semi-arid - 51% short vegetation cover",
+        False,
+        "D7D769",
+        (215, 215, 105),
+    ),
+    (
+        13,
+        "terra-firma-semi-arid-55-short-vegetation-cover",
+        "Semi-arid - 55% short vegetation cover",
+        False,
+        "D3D360",
+        (211, 211, 96),
+    ),
+    (
+        14,
+        "terra-firma-semi-arid-59-short-vegetation-cover",
+        "Semi-arid - 59% short vegetation cover",
+        False,
+        "D0D058",
+        (208, 208, 88),
+    ),
+    (
+        15,
+        "terra-firma-semi-arid-63-short-vegetation-cover",
+        "Semi-arid - 63% short vegetation cover",
+        False,
+        "CDCD50",
+        (205, 205, 80),
+    ),
+    (
+        16,
+        "terra-firma-semi-arid-67-short-vegetation-cover",
+        "Semi-arid - 67% short vegetation cover",
+        False,
+        "CACA48",
+        (202, 202, 72),
+    ),
+    (
+        17,
+        "terra-firma-semi-arid-71-short-vegetation-cover",
+        "Semi-arid - 71% short vegetation cover",
+        False,
+        "C6C63F",
+        (198, 198, 63),
+    ),
+    (
+        18,
+        "terra-firma-semi-arid-75-short-vegetation-cover",
+        "Semi-arid - 75% short vegetation cover",
+        False,
+        "C3C337",
+        (195, 195, 55),
+    ),
+    (
+        19,
+        "terra-firma-dense-short-vegetation-79-short-vegetation-cover",
+        "Dense short vegetation - 79% short vegetation cover",
+        False,
+        "C0C02F",
+        (192, 192, 47),
+    ),
+    (
+        20,
+        "terra-firma-dense-short-vegetation-83-short-vegetation-cover",
+        "Dense short vegetation - 83% short vegetation cover",
+        False,
+        "BDBD27",
+        (189, 189, 39),
+    ),
+    (
+        21,
+        "terra-firma-dense-short-vegetation-87-short-vegetation-cover",
+        "Dense short vegetation - 87% short vegetation cover",
+        False,
+        "B9B91E",
+        (185, 185, 30),
+    ),
+    (
+        22,
+        "terra-firma-dense-short-vegetation-91-short-vegetation-cover",
+        "Dense short vegetation - 91% short vegetation cover",
+        False,
+        "B6B616",
+        (182, 182, 22),
+    ),
+    (
+        23,
+        "terra-firma-dense-short-vegetation-95-short-vegetation-cover",
+        "Dense short vegetation - 95% short vegetation cover",
+        False,
+        "B3B30E",
+        (179, 179, 14),
+    ),
+    (
+        24,
+        "terra-firma-dense-short-vegetation-100-short-vegetation-cover",
+        "Dense short vegetation - 100% short vegetation cover",
+        False,
+        "B0B006",
+        (176, 176, 6),
+    ),
+    (
+        25,
+        "terra-firma-tree-cover-3m-trees",
+        "Tree cover - 3m trees",
+        False,
+        "609C60",
+        (96, 156, 96),
+    ),
+    (
+        26,
+        "terra-firma-tree-cover-4m-trees",
+        "Tree cover - 4m trees",
+        False,
+        "5C985C",
+        (92, 152, 92),
+    ),
+    (
+        27,
+        "terra-firma-tree-cover-5m-trees",
+        "Tree cover - 5m trees",
+        False,
+        "589558",
+        (88, 149, 88),
+    ),
+    (
+        28,
+        "terra-firma-tree-cover-6m-trees",
+        "Tree cover - 6m trees",
+        False,
+        "549254",
+        (84, 146, 84),
+    ),
+    (
+        29,
+        "terra-firma-tree-cover-7m-trees",
+        "Tree cover - 7m trees",
+        False,
+        "508E50",
+        (80, 142, 80),
+    ),
+    (
+        30,
+        "terra-firma-tree-cover-8m-trees",
+        "Tree cover - 8m trees",
+        False,
+        "4C8B4C",
+        (76, 139, 76),
+    ),
+    (
+        31,
+        "terra-firma-tree-cover-9m-trees",
+        "Tree cover - 9m trees",
+        False,
+        "488848",
+        (72, 136, 72),
+    ),
+    (
+        32,
+        "terra-firma-tree-cover-10m-trees",
+        "Tree cover - 10m trees",
+        False,
+        "448544",
+        (68, 133, 68),
+    ),
+    (
+        33,
+        "terra-firma-tree-cover-11m-trees",
+        "Tree cover - 11m trees",
+        False,
+        "408140",
+        (64, 129, 64),
+    ),
+    (
+        34,
+        "terra-firma-tree-cover-12m-trees",
+        "Tree cover - 12m trees",
+        False,
+        "3C7E3C",
+        (60, 126, 60),
+    ),
+    (
+        35,
+        "terra-firma-tree-cover-13m-trees",
+        "Tree cover - 13m trees",
+        False,
+        "387B38",
+        (56, 123, 56),
+    ),
+    (
+        36,
+        "terra-firma-tree-cover-14m-trees",
+        "Tree cover - 14m trees",
+        False,
+        "347834",
+        (52, 120, 52),
+    ),
+    (
+        37,
+        "terra-firma-tree-cover-15m-trees",
+        "Tree cover - 15m trees",
+        False,
+        "317431",
+        (49, 116, 49),
+    ),
+    (
+        38,
+        "terra-firma-tree-cover-16m-trees",
+        "Tree cover - 16m trees",
+        False,
+        "2D712D",
+        (45, 113, 45),
+    ),
+    (
+        39,
+        "terra-firma-tree-cover-17m-trees",
+        "Tree cover - 17m trees",
+        False,
+        "296E29",
+        (41, 110, 41),
+    ),
+    (
+        40,
+        "terra-firma-tree-cover-18m-trees",
+        "Tree cover - 18m trees",
+        False,
+        "256B25",
+        (37, 107, 37),
+    ),
+    (
+        41,
+        "terra-firma-tree-cover-19m-trees",
+        "Tree cover - 19m trees",
+        False,
+        "216721",
+        (33, 103, 33),
+    ),
+    (
+        42,
+        "terra-firma-tree-cover-20m-trees",
+        "Tree cover - 20m trees",
+        False,
+        "1D641D",
+        (29, 100, 29),
+    ),
+    (
+        43,
+        "terra-firma-tree-cover-21m-trees",
+        "Tree cover - 21m trees",
+        False,
+        "196119",
+        (25, 97, 25),
+    ),
+    (
+        44,
+        "terra-firma-tree-cover-22m-trees",
+        "Tree cover - 22m trees",
+        False,
+        "155E15",
+        (21, 94, 21),
+    ),
+    (
+        45,
+        "terra-firma-tree-cover-23m-trees",
+        "Tree cover - 23m trees",
+        False,
+        "115A11",
+        (17, 90, 17),
+    ),
+    (
+        46,
+        "terra-firma-tree-cover-24m-trees",
+        "Tree cover - 24m trees",
+        False,
+        "0D570D",
+        (13, 87, 13),
+    ),
+    (
+        47,
+        "terra-firma-tree-cover-25m-trees",
+        "Tree cover - 25m trees",
+        False,
+        "095409",
+        (9, 84, 9),
+    ),
+    (
+        48,
+        "terra-firma-tree-cover-25m-trees",
+        "Tree cover - >25m trees",
+        False,
+        "065106",
+        (6, 81, 6),
+    ),
+    (
+        100,
+        "wetland-salt-pan-3-short-vegetation-cover",
+        "Salt pan - 3% short vegetation cover",
+        False,
+        "BFC0C0",
+        (191, 192, 192),
+    ),
+    (
+        101,
+        "wetland-salt-pan-7-short-vegetation-cover",
+        "Salt pan - 7% short vegetation cover",
+        False,
+        "B7BDC2",
+        (183, 189, 194),
+    ),
+    (
+        102,
+        "wetland-sparse-vegetation-11-short-vegetation-cover",
+        "Sparse vegetation - 11% short vegetation cover",
+        False,
+        "AFBBC4",
+        (175, 187, 196),
+    ),
+    (
+        103,
+        "wetland-sparse-vegetation-15-short-vegetation-cover",
+        "Sparse vegetation - 15% short vegetation cover",
+        False,
+        "A8B8C6",
+        (168, 184, 198),
+    ),
+    (
+        104,
+        "wetland-sparse-vegetation-19-short-vegetation-cover",
+        "Sparse vegetation - 19% short vegetation cover",
+        False,
+        "A0B6C9",
+        (160, 182, 201),
+    ),
+    (
+        105,
+        "wetland-sparse-vegetation-23-short-vegetation-cover",
+        "Sparse vegetation - 23% short vegetation cover",
+        False,
+        "99B3CB",
+        (153, 179, 203),
+    ),
+    (
+        106,
+        "wetland-sparse-vegetation-27-short-vegetation-cover",
+        "Sparse vegetation - 27% short vegetation cover",
+        False,
+        "91B1CD",
+        (145, 177, 205),
+    ),
+    (
+        107,
+        "wetland-sparse-vegetation-31-short-vegetation-cover",
+        "Sparse vegetation - 31% short vegetation cover",
+        False,
+        "89AFD0",
+        (137, 175, 208),
+    ),
+    (
+        108,
+        "wetland-sparse-vegetation-35-short-vegetation-cover",
+        "Sparse vegetation - 35% short vegetation cover",
+        False,
+        "82ACD2",
+        (130, 172, 210),
+    ),
+    (
+        109,
+        "wetland-sparse-vegetation-39-short-vegetation-cover",
+        "Sparse vegetation - 39% short vegetation cover",
+        False,
+        "7AAAD4",
+        (122, 170, 212),
+    ),
+    (
+        110,
+        "wetland-sparse-vegetation-43-short-vegetation-cover",
+        "Sparse vegetation - 43% short vegetation cover",
+        False,
+        "73A7D6",
+        (115, 167, 214),
+    ),
+    (
+        111,
+        "wetland-sparse-vegetation-47-short-vegetation-cover",
+        "Sparse vegetation - 47% short vegetation cover",
+        False,
+        "6BA5D9",
+        (107, 165, 217),
+    ),
+    (
+        112,
+        "wetland-sparse-vegetation-51-short-vegetation-cover",
+        "Sparse vegetation - 51% short vegetation cover",
+        False,
+        "64A3DB",
+        (100, 163, 219),
+    ),
+    (
+        113,
+        "wetland-sparse-vegetation-55-short-vegetation-cover",
+        "Sparse vegetation - 55% short vegetation cover",
+        False,
+        "5CA0DD",
+        (92, 160, 221),
+    ),
+    (
+        114,
+        "wetland-sparse-vegetation-59-short-vegetation-cover",
+        "Sparse vegetation - 59% short vegetation cover",
+        False,
+        "549EE0",
+        (84, 158, 224),
+    ),
+    (
+        115,
+        "wetland-sparse-vegetation-63-short-vegetation-cover",
+        "Sparse vegetation - 63% short vegetation cover",
+        False,
+        "4D9BE2",
+        (77, 155, 226),
+    ),
+    (
+        116,
+        "wetland-sparse-vegetation-67-short-vegetation-cover",
+        "Sparse vegetation - 67% short vegetation cover",
+        False,
+        "4599E4",
+        (69, 153, 228),
+    ),
+    (
+        117,
+        "wetland-sparse-vegetation-71-short-vegetation-cover",
+        "Sparse vegetation - 71% short vegetation cover",
+        False,
+        "3E96E6",
+        (62, 150, 230),
+    ),
+    (
+        118,
+        "wetland-sparse-vegetation-75-short-vegetation-cover",
+        "Sparse vegetation - 75% short vegetation cover",
+        False,
+        "3694E9",
+        (54, 148, 233),
+    ),
+    (
+        119,
+        "wetland-dense-short-vegetation-79-short-vegetation-cover",
+        "Dense short vegetation - 79% short vegetation cover",
+        False,
+        "2E92EB",
+        (46, 146, 235),
+    ),
+    (
+        120,
+        "wetland-dense-short-vegetation-83-short-vegetation-cover",
+        "Dense short vegetation - 83% short vegetation cover",
+        False,
+        "278FED",
+        (39, 143, 237),
+    ),
+    (
+        121,
+        "wetland-dense-short-vegetation-87-short-vegetation-cover",
+        "Dense short vegetation - 87% short vegetation cover",
+        False,
+        "1F8DF0",
+        (31, 141, 240),
+    ),
+    (
+        122,
+        "wetland-dense-short-vegetation-91-short-vegetation-cover",
+        "Dense short vegetation - 91% short vegetation cover",
+        False,
+        "188AF2",
+        (24, 138, 242),
+    ),
+    (
+        123,
+        "wetland-dense-short-vegetation-95-short-vegetation-cover",
+        "Dense short vegetation - 95% short vegetation cover",
+        False,
+        "1088F4",
+        (16, 136, 244),
+    ),
+    (
+        124,
+        "wetland-dense-short-vegetation-100-short-vegetation-cover",
+        "Dense short vegetation - 100% short vegetation cover",
+        False,
+        "0986F7",
+        (9, 134, 247),
+    ),
+    (
+        125,
+        "wetland-tree-cover-3m-trees",
+        "Tree cover - 3m trees",
+        False,
+        "55A5A5",
+        (85, 165, 165),
+    ),
+    (
+        126,
+        "wetland-tree-cover-4m-trees",
+        "Tree cover - 4m trees",
+        False,
+        "53A1A2",
+        (83, 161, 162),
+    ),
+    (
+        127,
+        "wetland-tree-cover-5m-trees",
+        "Tree cover - 5m trees",
+        False,
+        "519E9F",
+        (81, 158, 159),
+    ),
+    (
+        128,
+        "wetland-tree-cover-6m-trees",
+        "Tree cover - 6m trees",
+        False,
+        "4F9B9C",
+        (79, 155, 156),
+    ),
+    (
+        129,
+        "wetland-tree-cover-7m-trees",
+        "Tree cover - 7m trees",
+        False,
+        "4D989A",
+        (77, 152, 154),
+    ),
+    (
+        130,
+        "wetland-tree-cover-8m-trees",
+        "Tree cover - 8m trees",
+        False,
+        "4B9597",
+        (75, 149, 151),
+    ),
+    (
+        131,
+        "wetland-tree-cover-9m-trees",
+        "Tree cover - 9m trees",
+        False,
+        "499294",
+        (73, 146, 148),
+    ),
+    (
+        132,
+        "wetland-tree-cover-10m-trees",
+        "Tree cover - 10m trees",
+        False,
+        "478F91",
+        (71, 143, 145),
+    ),
+    (
+        133,
+        "wetland-tree-cover-11m-trees",
+        "Tree cover - 11m trees",
+        False,
+        "458B8F",
+        (69, 139, 143),
+    ),
+    (
+        134,
+        "wetland-tree-cover-12m-trees",
+        "Tree cover - 12m trees",
+        False,
+        "43888C",
+        (67, 136, 140),
+    ),
+    (
+        135,
+        "wetland-tree-cover-13m-trees",
+        "Tree cover - 13m trees",
+        False,
+        "418589",
+        (65, 133, 137),
+    ),
+    (
+        136,
+        "wetland-tree-cover-14m-trees",
+        "Tree cover - 14m trees",
+        False,
+        "3F8286",
+        (63, 130, 134),
+    ),
+    (
+        137,
+        "wetland-tree-cover-15m-trees",
+        "Tree cover - 15m trees",
+        False,
+        "3D7F84",
+        (61, 127, 132),
+    ),
+    (
+        138,
+        "wetland-tree-cover-16m-trees",
+        "Tree cover - 16m trees",
+        False,
+        "3B7C81",
+        (59, 124, 129),
+    ),
+    (
+        139,
+        "wetland-tree-cover-17m-trees",
+        "Tree cover - 17m trees",
+        False,
+        "39797E",
+        (57, 121, 126),
+    ),
+    (
+        140,
+        "wetland-tree-cover-18m-trees",
+        "Tree cover - 18m trees",
+        False,
+        "37767B",
+        (55, 118, 123),
+    ),
+    (
+        141,
+        "wetland-tree-cover-19m-trees",
+        "Tree cover - 19m trees",
+        False,
+        "357279",
+        (53, 114, 121),
+    ),
+    (
+        142,
+        "wetland-tree-cover-20m-trees",
+        "Tree cover - 20m trees",
+        False,
+        "336F76",
+        (51, 111, 118),
+    ),
+    (
+        143,
+        "wetland-tree-cover-21m-trees",
+        "Tree cover - 21m trees",
+        False,
+        "316C73",
+        (49, 108, 115),
+    ),
+    (
+        144,
+        "wetland-tree-cover-22m-trees",
+        "Tree cover - 22m trees",
+        False,
+        "2F6970",
+        (47, 105, 112),
+    ),
+    (
+        145,
+        "wetland-tree-cover-23m-trees",
+        "Tree cover - 23m trees",
+        False,
+        "2D666E",
+        (45, 102, 110),
+    ),
+    (
+        146,
+        "wetland-tree-cover-24m-trees",
+        "Tree cover - 24m trees",
+        False,
+        "2B636B",
+        (43, 99, 107),
+    ),
+    (
+        147,
+        "wetland-tree-cover-25m-trees",
+        "Tree cover - 25m trees",
+        False,
+        "296068",
+        (41, 96, 104),
+    ),
+    (
+        148,
+        "wetland-tree-cover-25m-trees",
+        "Tree cover - >25m trees",
+        False,
+        "285D66",
+        (40, 93, 102),
+    ),
+    (
+        200,
+        "open-surface-water-open-surface-water-20-29-of-year",
+        "Open surface water - 20-29% of year",
+        False,
+        "1964EB",
+        (25, 100, 235),
+    ),
+    (
+        201,
+        "open-surface-water-open-surface-water-30-39-of-year",
+        "Open surface water - 30-39% of year",
+        False,
+        "1555E4",
+        (21, 85, 228),
+    ),
+    (
+        202,
+        "open-surface-water-open-surface-water-40-49-of-year",
+        "Open surface water - 40-49% of year",
+        False,
+        "1147DD",
+        (17, 71, 221),
+    ),
+    (
+        203,
+        "open-surface-water-open-surface-water-50-59-of-year",
+        "Open surface water - 50-59% of year",
+        False,
+        "0E39D6",
+        (14, 57, 214),
+    ),
+    (
+        204,
+        "open-surface-water-open-surface-water-60-69-of-year",
+        "Open surface water - 60-69% of year",
+        False,
+        "0A2ACF",
+        (10, 42, 207),
+    ),
+    (
+        205,
+        "open-surface-water-open-surface-water-70-79-of-year",
+        "Open surface water - 70-79% of year",
+        False,
+        "071CC8",
+        (7, 28, 200),
+    ),
+    (
+        206,
+        "open-surface-water-open-surface-water-80-89-of-year",
+        "Open surface water - 80-89% of year",
+        False,
+        "030EC1",
+        (3, 14, 193),
+    ),
+    (
+        207,
+        "open-surface-water-open-surface-water-90-100-of-year",
+        "Open surface water - 90-100% of year",
+        False,
+        "0000BA",
+        (0, 0, 186),
+    ),
+    (
+        241,
+        "snow-ice-snow-ice",
+        "Snow/ice",
+        False,
+        "ffffff",
+        (255, 255, 255),
+    ),
+    (
+        244,
+        "cropland-cropland",
+        "Cropland",
+        False,
+        "ff7d00",
+        (255, 125, 0),
+    ),
+    (
+        250,
+        "built-up-built-up",
+        "Built-up",
+        False,
+        "64dcdc",
+        (100, 220, 220),
+    ),
+    (
+        254,
+        "ocean-ocean",
+        "Ocean",
+        False,
+        "111133",
+        (17, 17, 51),
+    ),
+    (
+        255,
+        "no-data-no-data",
+        "No data",
+        True,
+        None,
+        None,
+    ),
+]
+
+CHANGE: List[ClassificationRow] = [
+    (
+        0,
+        "terra-firma-true-desert-3-short-vegetation-cover",
+        "True desert - 3% short vegetation cover",
+        False,
+        "FEFECC",
+        (254, 254, 204),
+    ),
+    (
+        1,
+        "terra-firma-true-desert-7-short-vegetation-cover",
+        "True desert - 7% short vegetation cover",
+        False,
+        "FAFAC3",
+        (250, 250, 195),
+    ),
+    (
+        2,
+        "terra-firma-semi-arid-11-short-vegetation-cover",
+        "Semi-arid - 11% short vegetation cover",
+        False,
+        "F7F7BB",
+        (247, 247, 187),
+    ),
+    (
+        3,
+        "terra-firma-semi-arid-15-short-vegetation-cover",
+        "Semi-arid - 15% short vegetation cover",
+        False,
+        "F4F4B3",
+        (244, 244, 179),
+    ),
+    (
+        4,
+        "terra-firma-semi-arid-19-short-vegetation-cover",
+        "Semi-arid - 19% short vegetation cover",
+        False,
+        "F1F1AB",
+        (241, 241, 171),
+    ),
+    (
+        5,
+        "terra-firma-semi-arid-23-short-vegetation-cover",
+        "Semi-arid - 23% short vegetation cover",
+        False,
+        "EDEDA2",
+        (237, 237, 162),
+    ),
+    (
+        6,
+        "terra-firma-semi-arid-27-short-vegetation-cover",
+        "Semi-arid - 27% short vegetation cover",
+        False,
+        "EAEA9A",
+        (234, 234, 154),
+    ),
+    (
+        7,
+        "terra-firma-semi-arid-31-short-vegetation-cover",
+        "Semi-arid - 31% short vegetation cover",
+        False,
+        "E7E792",
+        (231, 231, 146),
+    ),
+    (
+        8,
+        "terra-firma-semi-arid-35-short-vegetation-cover",
+        "Semi-arid - 35% short vegetation cover",
+        False,
+        "E4E48A",
+        (228, 228, 138),
+    ),
+    (
+        9,
+        "terra-firma-semi-arid-39-short-vegetation-cover",
+        "Semi-arid - 39% short vegetation cover",
+        False,
+        "E0E081",
+        (224, 224, 129),
+    ),
+    (
+        10,
+        "terra-firma-semi-arid-43-short-vegetation-cover",
+        "Semi-arid - 43% short vegetation cover",
+        False,
+        "DDDD79",
+        (221, 221, 121),
+    ),
+    (
+        11,
+        "terra-firma-semi-arid-47-short-vegetation-cover",
+        "Semi-arid - 47% short vegetation cover",
+        False,
+        "DADA71",
+        (218, 218, 113),
+    ),
+    (
+        12,
+        "terra-firma-semi-arid-51-short-vegetation-cover",
+        "Semi-arid - 51% short vegetation cover",
+        False,
+        "D7D769",
+        (215, 215, 105),
+    ),
+    (
+        13,
+        "terra-firma-semi-arid-55-short-vegetation-cover",
+        "Semi-arid - 55% short vegetation cover",
+        False,
+        "D3D360",
+        (211, 211, 96),
+    ),
+    (
+        14,
+        "terra-firma-semi-arid-59-short-vegetation-cover",
+        "Semi-arid - 59% short vegetation cover",
+        False,
+        "D0D058",
+        (208, 208, 88),
+    ),
+    (
+        15,
+        "terra-firma-semi-arid-63-short-vegetation-cover",
+        "Semi-arid - 63% short vegetation cover",
+        False,
+        "CDCD50",
+        (205, 205, 80),
+    ),
+    (
+        16,
+        "terra-firma-semi-arid-67-short-vegetation-cover",
+        "Semi-arid - 67% short vegetation cover",
+        False,
+        "CACA48",
+        (202, 202, 72),
+    ),
+    (
+        17,
+        "terra-firma-semi-arid-71-short-vegetation-cover",
+        "Semi-arid - 71% short vegetation cover",
+        False,
+        "C6C63F",
+        (198, 198, 63),
+    ),
+    (
+        18,
+        "terra-firma-semi-arid-75-short-vegetation-cover",
+        "Semi-arid - 75% short vegetation cover",
+        False,
+        "C3C337",
+        (195, 195, 55),
+    ),
+    (
+        19,
+        "terra-firma-dense-short-vegetation-79-short-vegetation-cover",
+        "Dense short vegetation - 79% short vegetation cover",
+        False,
+        "C0C02F",
+        (192, 192, 47),
+    ),
+    (
+        20,
+        "terra-firma-dense-short-vegetation-83-short-vegetation-cover",
+        "Dense short vegetation - 83% short vegetation cover",
+        False,
+        "BDBD27",
+        (189, 189, 39),
+    ),
+    (
+        21,
+        "terra-firma-dense-short-vegetation-87-short-vegetation-cover",
+        "Dense short vegetation - 87% short vegetation cover",
+        False,
+        "B9B91E",
+        (185, 185, 30),
+    ),
+    (
+        22,
+        "terra-firma-dense-short-vegetation-91-short-vegetation-cover",
+        "Dense short vegetation - 91% short vegetation cover",
+        False,
+        "B6B616",
+        (182, 182, 22),
+    ),
+    (
+        23,
+        "terra-firma-dense-short-vegetation-95-short-vegetation-cover",
+        "Dense short vegetation - 95% short vegetation cover",
+        False,
+        "B3B30E",
+        (179, 179, 14),
+    ),
+    (
+        24,
+        "terra-firma-dense-short-vegetation-100-short-vegetation-cover",
+        "Dense short vegetation - 100% short vegetation cover",
+        False,
+        "B0B006",
+        (176, 176, 6),
+    ),
+    (
+        25,
+        "terra-firma-stable-tree-cover-3m-trees",
+        "Stable tree cover - 3m trees",
+        False,
+        "609C60",
+        (96, 156, 96),
+    ),
+    (
+        26,
+        "terra-firma-stable-tree-cover-4m-trees",
+        "Stable tree cover - 4m trees",
+        False,
+        "5C985C",
+        (92, 152, 92),
+    ),
+    (
+        27,
+        "terra-firma-stable-tree-cover-5m-trees",
+        "Stable tree cover - 5m trees",
+        False,
+        "589558",
+        (88, 149, 88),
+    ),
+    (
+        28,
+        "terra-firma-stable-tree-cover-6m-trees",
+        "Stable tree cover - 6m trees",
+        False,
+        "549254",
+        (84, 146, 84),
+    ),
+    (
+        29,
+        "terra-firma-stable-tree-cover-7m-trees",
+        "Stable tree cover - 7m trees",
+        False,
+        "508E50",
+        (80, 142, 80),
+    ),
+    (
+        30,
+        "terra-firma-stable-tree-cover-8m-trees",
+        "Stable tree cover - 8m trees",
+        False,
+        "4C8B4C",
+        (76, 139, 76),
+    ),
+    (
+        31,
+        "terra-firma-stable-tree-cover-9m-trees",
+        "Stable tree cover - 9m trees",
+        False,
+        "488848",
+        (72, 136, 72),
+    ),
+    (
+        32,
+        "terra-firma-stable-tree-cover-10m-trees",
+        "Stable tree cover - 10m trees",
+        False,
+        "448544",
+        (68, 133, 68),
+    ),
+    (
+        33,
+        "terra-firma-stable-tree-cover-11m-trees",
+        "Stable tree cover - 11m trees",
+        False,
+        "408140",
+        (64, 129, 64),
+    ),
+    (
+        34,
+        "terra-firma-stable-tree-cover-12m-trees",
+        "Stable tree cover - 12m trees",
+        False,
+        "3C7E3C",
+        (60, 126, 60),
+    ),
+    (
+        35,
+        "terra-firma-stable-tree-cover-13m-trees",
+        "Stable tree cover - 13m trees",
+        False,
+        "387B38",
+        (56, 123, 56),
+    ),
+    (
+        36,
+        "terra-firma-stable-tree-cover-14m-trees",
+        "Stable tree cover - 14m trees",
+        False,
+        "347834",
+        (52, 120, 52),
+    ),
+    (
+        37,
+        "terra-firma-stable-tree-cover-15m-trees",
+        "Stable tree cover - 15m trees",
+        False,
+        "317431",
+        (49, 116, 49),
+    ),
+    (
+        38,
+        "terra-firma-stable-tree-cover-16m-trees",
+        "Stable tree cover - 16m trees",
+        False,
+        "2D712D",
+        (45, 113, 45),
+    ),
+    (
+        39,
+        "terra-firma-stable-tree-cover-17m-trees",
+        "Stable tree cover - 17m trees",
+        False,
+        "296E29",
+        (41, 110, 41),
+    ),
+    (
+        40,
+        "terra-firma-stable-tree-cover-18m-trees",
+        "Stable tree cover - 18m trees",
+        False,
+        "256B25",
+        (37, 107, 37),
+    ),
+    (
+        41,
+        "terra-firma-stable-tree-cover-19m-trees",
+        "Stable tree cover - 19m trees",
+        False,
+        "216721",
+        (33, 103, 33),
+    ),
+    (
+        42,
+        "terra-firma-stable-tree-cover-20m-trees",
+        "Stable tree cover - 20m trees",
+        False,
+        "1D641D",
+        (29, 100, 29),
+    ),
+    (
+        43,
+        "terra-firma-stable-tree-cover-21m-trees",
+        "Stable tree cover - 21m trees",
+        False,
+        "196119",
+        (25, 97, 25),
+    ),
+    (
+        44,
+        "terra-firma-stable-tree-cover-22m-trees",
+        "Stable tree cover - 22m trees",
+        False,
+        "155E15",
+        (21, 94, 21),
+    ),
+    (
+        45,
+        "terra-firma-stable-tree-cover-23m-trees",
+        "Stable tree cover - 23m trees",
+        False,
+        "115A11",
+        (17, 90, 17),
+    ),
+    (
+        46,
+        "terra-firma-stable-tree-cover-24m-trees",
+        "Stable tree cover - 24m trees",
+        False,
+        "0D570D",
+        (13, 87, 13),
+    ),
+    (
+        47,
+        "terra-firma-stable-tree-cover-25m-trees",
+        "Stable tree cover - 25m trees",
+        False,
+        "095409",
+        (9, 84, 9),
+    ),
+    (
+        48,
+        "terra-firma-stable-tree-cover-25m-trees",
+        "Stable tree cover - >25m trees",
+        False,
+        "065106",
+        (6, 81, 6),
+    ),
+    (
+        49,
+        "terra-firma-tree-cover-with-previous-disturbance-2020-height-3m-trees",
+        "Tree cover with previous disturbance (2020 height) - 3m trees",
+        False,
+        "643700",
+        (100, 55, 0),
+    ),
+    (
+        50,
+        "terra-firma-tree-cover-with-previous-disturbance-2020-height-4m-trees",
+        "Tree cover with previous disturbance (2020 height) - 4m trees",
+        False,
+        "643a00",
+        (100, 58, 0),
+    ),
+    (
+        51,
+        "terra-firma-tree-cover-with-previous-disturbance-2020-height-5m-trees",
+        "Tree cover with previous disturbance (2020 height) - 5m trees",
+        False,
+        "643d00",
+        (100, 61, 0),
+    ),
+    (
+        52,
+        "terra-firma-tree-cover-with-previous-disturbance-2020-height-6m-trees",
+        "Tree cover with previous disturbance (2020 height) - 6m trees",
+        False,
+        "644000",
+        (100, 64, 0),
+    ),
+    (
+        53,
+        "terra-firma-tree-cover-with-previous-disturbance-2020-height-7m-trees",
+        "Tree cover with previous disturbance (2020 height) - 7m trees",
+        False,
+        "644300",
+        (100, 67, 0),
+    ),
+    (
+        54,
+        "terra-firma-tree-cover-with-previous-disturbance-2020-height-8m-trees",
+        "Tree cover with previous disturbance (2020 height) - 8m trees",
+        False,
+        "644600",
+        (100, 70, 0),
+    ),
+    (
+        55,
+        "terra-firma-tree-cover-with-previous-disturbance-2020-height-9m-trees",
+        "Tree cover with previous disturbance (2020 height) - 9m trees",
+        False,
+        "644900",
+        (100, 73, 0),
+    ),
+    (
+        56,
+        "terra-firma-tree-cover-with-previous-disturbance-2020-height-10m-trees",
+        "Tree cover with previous disturbance (2020 height) - 10m trees",
+        False,
+        "654c00",
+        (101, 76, 0),
+    ),
+    (
+        57,
+        "terra-firma-tree-cover-with-previous-disturbance-2020-height-11m-trees",
+        "Tree cover with previous disturbance (2020 height) - 11m trees",
+        False,
+        "654f00",
+        (101, 79, 0),
+    ),
+    (
+        58,
+        "terra-firma-tree-cover-with-previous-disturbance-2020-height-12m-trees",
+        "Tree cover with previous disturbance (2020 height) - 12m trees",
+        False,
+        "655200",
+        (101, 82, 0),
+    ),
+    (
+        59,
+        "terra-firma-tree-cover-with-previous-disturbance-2020-height-13m-trees",
+        "Tree cover with previous disturbance (2020 height) - 13m trees",
+        False,
+        "655500",
+        (101, 85, 0),
+    ),
+    (
+        60,
+        "terra-firma-tree-cover-with-previous-disturbance-2020-height-14m-trees",
+        "Tree cover with previous disturbance (2020 height) - 14m trees",
+        False,
+        "655800",
+        (101, 88, 0),
+    ),
+    (
+        61,
+        "terra-firma-tree-cover-with-previous-disturbance-2020-height-15m-trees",
+        "Tree cover with previous disturbance (2020 height) - 15m trees",
+        False,
+        "655a00",
+        (101, 90, 0),
+    ),
+    (
+        62,
+        "terra-firma-tree-cover-with-previous-disturbance-2020-height-16m-trees",
+        "Tree cover with previous disturbance (2020 height) - 16m trees",
+        False,
+        "655d00",
+        (101, 93, 0),
+    ),
+    (
+        63,
+        "terra-firma-tree-cover-with-previous-disturbance-2020-height-17m-trees",
+        "Tree cover with previous disturbance (2020 height) - 17m trees",
+        False,
+        "656000",
+        (101, 96, 0),
+    ),
+    (
+        64,
+        "terra-firma-tree-cover-with-previous-disturbance-2020-height-18m-trees",
+        "Tree cover with previous disturbance (2020 height) - 18m trees",
+        False,
+        "656300",
+        (101, 99, 0),
+    ),
+    (
+        65,
+        "terra-firma-tree-cover-with-previous-disturbance-2020-height-19m-trees",
+        "Tree cover with previous disturbance (2020 height) - 19m trees",
+        False,
+        "666600",
+        (102, 102, 0),
+    ),
+    (
+        66,
+        "terra-firma-tree-cover-with-previous-disturbance-2020-height-20m-trees",
+        "Tree cover with previous disturbance (2020 height) - 20m trees",
+        False,
+        "666900",
+        (102, 105, 0),
+    ),
+    (
+        67,
+        "terra-firma-tree-cover-with-previous-disturbance-2020-height-21m-trees",
+        "Tree cover with previous disturbance (2020 height) - 21m trees",
+        False,
+        "666c00",
+        (102, 108, 0),
+    ),
+    (
+        68,
+        "terra-firma-tree-cover-with-previous-disturbance-2020-height-22m-trees",
+        "Tree cover with previous disturbance (2020 height) - 22m trees",
+        False,
+        "666f00",
+        (102, 111, 0),
+    ),
+    (
+        69,
+        "terra-firma-tree-cover-with-previous-disturbance-2020-height-23m-trees",
+        "Tree cover with previous disturbance (2020 height) - 23m trees",
+        False,
+        "667200",
+        (102, 114, 0),
+    ),
+    (
+        70,
+        "terra-firma-tree-cover-with-previous-disturbance-2020-height-24m-trees",
+        "Tree cover with previous disturbance (2020 height) - 24m trees",
+        False,
+        "667500",
+        (102, 117, 0),
+    ),
+    (
+        71,
+        "terra-firma-tree-cover-with-previous-disturbance-2020-height-25m-trees",
+        "Tree cover with previous disturbance (2020 height) - 25m trees",
+        False,
+        "667800",
+        (102, 120, 0),
+    ),
+    (
+        72,
+        "terra-firma-tree-cover-with-previous-disturbance-2020-height-25m-trees",
+        "Tree cover with previous disturbance (2020 height) - >25m trees",
+        False,
+        "667b00",
+        (102, 123, 0),
+    ),
+    (
+        73,
+        "terra-firma-tree-height-gain-2020-height-3m-trees",
+        "Tree height gain (2020 height) - 3m trees",
+        False,
+        "ff99ff",
+        (255, 153, 255),
+    ),
+    (
+        74,
+        "terra-firma-tree-height-gain-2020-height-4m-trees",
+        "Tree height gain (2020 height) - 4m trees",
+        False,
+        "FC92FC",
+        (252, 146, 252),
+    ),
+    (
+        75,
+        "terra-firma-tree-height-gain-2020-height-5m-trees",
+        "Tree height gain (2020 height) - 5m trees",
+        False,
+        "F98BF9",
+        (249, 139, 249),
+    ),
+    (
+        76,
+        "terra-firma-tree-height-gain-2020-height-6m-trees",
+        "Tree height gain (2020 height) - 6m trees",
+        False,
+        "F685F6",
+        (246, 133, 246),
+    ),
+    (
+        77,
+        "terra-firma-tree-height-gain-2020-height-7m-trees",
+        "Tree height gain (2020 height) - 7m trees",
+        False,
+        "F37EF3",
+        (243, 126, 243),
+    ),
+    (
+        78,
+        "terra-firma-tree-height-gain-2020-height-8m-trees",
+        "Tree height gain (2020 height) - 8m trees",
+        False,
+        "F077F0",
+        (240, 119, 240),
+    ),
+    (
+        79,
+        "terra-firma-tree-height-gain-2020-height-9m-trees",
+        "Tree height gain (2020 height) - 9m trees",
+        False,
+        "ED71ED",
+        (237, 113, 237),
+    ),
+    (
+        80,
+        "terra-firma-tree-height-gain-2020-height-10m-trees",
+        "Tree height gain (2020 height) - 10m trees",
+        False,
+        "EA6AEA",
+        (234, 106, 234),
+    ),
+    (
+        81,
+        "terra-firma-tree-height-gain-2020-height-11m-trees",
+        "Tree height gain (2020 height) - 11m trees",
+        False,
+        "E763E7",
+        (231, 99, 231),
+    ),
+    (
+        82,
+        "terra-firma-tree-height-gain-2020-height-12m-trees",
+        "Tree height gain (2020 height) - 12m trees",
+        False,
+        "E45DE4",
+        (228, 93, 228),
+    ),
+    (
+        83,
+        "terra-firma-tree-height-gain-2020-height-13m-trees",
+        "Tree height gain (2020 height) - 13m trees",
+        False,
+        "E156E1",
+        (225, 86, 225),
+    ),
+    (
+        84,
+        "terra-firma-tree-height-gain-2020-height-14m-trees",
+        "Tree height gain (2020 height) - 14m trees",
+        False,
+        "DE4FDE",
+        (222, 79, 222),
+    ),
+    (
+        85,
+        "terra-firma-tree-height-gain-2020-height-15m-trees",
+        "Tree height gain (2020 height) - 15m trees",
+        False,
+        "DB49DB",
+        (219, 73, 219),
+    ),
+    (
+        86,
+        "terra-firma-tree-height-gain-2020-height-16m-trees",
+        "Tree height gain (2020 height) - 16m trees",
+        False,
+        "D842D8",
+        (216, 66, 216),
+    ),
+    (
+        87,
+        "terra-firma-tree-height-gain-2020-height-17m-trees",
+        "Tree height gain (2020 height) - 17m trees",
+        False,
+        "D53BD5",
+        (213, 59, 213),
+    ),
+    (
+        88,
+        "terra-firma-tree-height-gain-2020-height-18m-trees",
+        "Tree height gain (2020 height) - 18m trees",
+        False,
+        "D235D2",
+        (210, 53, 210),
+    ),
+    (
+        89,
+        "terra-firma-tree-height-gain-2020-height-19m-trees",
+        "Tree height gain (2020 height) - 19m trees",
+        False,
+        "CF2ECF",
+        (207, 46, 207),
+    ),
+    (
+        90,
+        "terra-firma-tree-height-gain-2020-height-20m-trees",
+        "Tree height gain (2020 height) - 20m trees",
+        False,
+        "CC27CC",
+        (204, 39, 204),
+    ),
+    (
+        91,
+        "terra-firma-tree-height-gain-2020-height-21m-trees",
+        "Tree height gain (2020 height) - 21m trees",
+        False,
+        "C921C9",
+        (201, 33, 201),
+    ),
+    (
+        92,
+        "terra-firma-tree-height-gain-2020-height-22m-trees",
+        "Tree height gain (2020 height) - 22m trees",
+        False,
+        "C61AC6",
+        (198, 26, 198),
+    ),
+    (
+        93,
+        "terra-firma-tree-height-gain-2020-height-23m-trees",
+        "Tree height gain (2020 height) - 23m trees",
+        False,
+        "C313C3",
+        (195, 19, 195),
+    ),
+    (
+        94,
+        "terra-firma-tree-height-gain-2020-height-24m-trees",
+        "Tree height gain (2020 height) - 24m trees",
+        False,
+        "C00DC0",
+        (192, 13, 192),
+    ),
+    (
+        95,
+        "terra-firma-tree-height-gain-2020-height-25m-trees",
+        "Tree height gain (2020 height) - 25m trees",
+        False,
+        "BD06BD",
+        (189, 6, 189),
+    ),
+    (
+        96,
+        "terra-firma-tree-height-gain-2020-height-25m-trees",
+        "Tree height gain (2020 height) - >25m trees",
+        False,
+        "bb00bb",
+        (187, 0, 187),
+    ),
+    (
+        100,
+        "wetland-salt-pan-3-short-vegetation-cover",
+        "Salt pan - 3% short vegetation cover",
+        False,
+        "BFC0C0",
+        (191, 192, 192),
+    ),
+    (
+        101,
+        "wetland-salt-pan-7-short-vegetation-cover",
+        "Salt pan - 7% short vegetation cover",
+        False,
+        "B7BDC2",
+        (183, 189, 194),
+    ),
+    (
+        102,
+        "wetland-sparse-vegetation-11-short-vegetation-cover",
+        "Sparse vegetation - 11% short vegetation cover",
+        False,
+        "AFBBC4",
+        (175, 187, 196),
+    ),
+    (
+        103,
+        "wetland-sparse-vegetation-15-short-vegetation-cover",
+        "Sparse vegetation - 15% short vegetation cover",
+        False,
+        "A8B8C6",
+        (168, 184, 198),
+    ),
+    (
+        104,
+        "wetland-sparse-vegetation-19-short-vegetation-cover",
+        "Sparse vegetation - 19% short vegetation cover",
+        False,
+        "A0B6C9",
+        (160, 182, 201),
+    ),
+    (
+        105,
+        "wetland-sparse-vegetation-23-short-vegetation-cover",
+        "Sparse vegetation - 23% short vegetation cover",
+        False,
+        "99B3CB",
+        (153, 179, 203),
+    ),
+    (
+        106,
+        "wetland-sparse-vegetation-27-short-vegetation-cover",
+        "Sparse vegetation - 27% short vegetation cover",
+        False,
+        "91B1CD",
+        (145, 177, 205),
+    ),
+    (
+        107,
+        "wetland-sparse-vegetation-31-short-vegetation-cover",
+        "Sparse vegetation - 31% short vegetation cover",
+        False,
+        "89AFD0",
+        (137, 175, 208),
+    ),
+    (
+        108,
+        "wetland-sparse-vegetation-35-short-vegetation-cover",
+        "Sparse vegetation - 35% short vegetation cover",
+        False,
+        "82ACD2",
+        (130, 172, 210),
+    ),
+    (
+        109,
+        "wetland-sparse-vegetation-39-short-vegetation-cover",
+        "Sparse vegetation - 39% short vegetation cover",
+        False,
+        "7AAAD4",
+        (122, 170, 212),
+    ),
+    (
+        110,
+        "wetland-sparse-vegetation-43-short-vegetation-cover",
+        "Sparse vegetation - 43% short vegetation cover",
+        False,
+        "73A7D6",
+        (115, 167, 214),
+    ),
+    (
+        111,
+        "wetland-sparse-vegetation-47-short-vegetation-cover",
+        "Sparse vegetation - 47% short vegetation cover",
+        False,
+        "6BA5D9",
+        (107, 165, 217),
+    ),
+    (
+        112,
+        "wetland-sparse-vegetation-51-short-vegetation-cover",
+        "Sparse vegetation - 51% short vegetation cover",
+        False,
+        "64A3DB",
+        (100, 163, 219),
+    ),
+    (
+        113,
+        "wetland-sparse-vegetation-55-short-vegetation-cover",
+        "Sparse vegetation - 55% short vegetation cover",
+        False,
+        "5CA0DD",
+        (92, 160, 221),
+    ),
+    (
+        114,
+        "wetland-sparse-vegetation-59-short-vegetation-cover",
+        "Sparse vegetation - 59% short vegetation cover",
+        False,
+        "549EE0",
+        (84, 158, 224),
+    ),
+    (
+        115,
+        "wetland-sparse-vegetation-63-short-vegetation-cover",
+        "Sparse vegetation - 63% short vegetation cover",
+        False,
+        "4D9BE2",
+        (77, 155, 226),
+    ),
+    (
+        116,
+        "wetland-sparse-vegetation-67-short-vegetation-cover",
+        "Sparse vegetation - 67% short vegetation cover",
+        False,
+        "4599E4",
+        (69, 153, 228),
+    ),
+    (
+        117,
+        "wetland-sparse-vegetation-71-short-vegetation-cover",
+        "Sparse vegetation - 71% short vegetation cover",
+        False,
+        "3E96E6",
+        (62, 150, 230),
+    ),
+    (
+        118,
+        "wetland-sparse-vegetation-75-short-vegetation-cover",
+        "Sparse vegetation - 75% short vegetation cover",
+        False,
+        "3694E9",
+        (54, 148, 233),
+    ),
+    (
+        119,
+        "wetland-dense-short-vegetation-79-short-vegetation-cover",
+        "Dense short vegetation - 79% short vegetation cover",
+        False,
+        "2E92EB",
+        (46, 146, 235),
+    ),
+    (
+        120,
+        "wetland-dense-short-vegetation-83-short-vegetation-cover",
+        "Dense short vegetation - 83% short vegetation cover",
+        False,
+        "278FED",
+        (39, 143, 237),
+    ),
+    (
+        121,
+        "wetland-dense-short-vegetation-87-short-vegetation-cover",
+        "Dense short vegetation - 87% short vegetation cover",
+        False,
+        "1F8DF0",
+        (31, 141, 240),
+    ),
+    (
+        122,
+        "wetland-dense-short-vegetation-91-short-vegetation-cover",
+        "Dense short vegetation - 91% short vegetation cover",
+        False,
+        "188AF2",
+        (24, 138, 242),
+    ),
+    (
+        123,
+        "wetland-dense-short-vegetation-95-short-vegetation-cover",
+        "Dense short vegetation - 95% short vegetation cover",
+        False,
+        "1088F4",
+        (16, 136, 244),
+    ),
+    (
+        124,
+        "wetland-dense-short-vegetation-100-short-vegetation-cover",
+        "Dense short vegetation - 100% short vegetation cover",
+        False,
+        "0986F7",
+        (9, 134, 247),
+    ),
+    (
+        125,
+        "wetland-stable-tree-cover-3m-trees",
+        "Stable tree cover - 3m trees",
+        False,
+        "55A5A5",
+        (85, 165, 165),
+    ),
+    (
+        126,
+        "wetland-stable-tree-cover-4m-trees",
+        "Stable tree cover - 4m trees",
+        False,
+        "53A1A2",
+        (83, 161, 162),
+    ),
+    (
+        127,
+        "wetland-stable-tree-cover-5m-trees",
+        "Stable tree cover - 5m trees",
+        False,
+        "519E9F",
+        (81, 158, 159),
+    ),
+    (
+        128,
+        "wetland-stable-tree-cover-6m-trees",
+        "Stable tree cover - 6m trees",
+        False,
+        "4F9B9C",
+        (79, 155, 156),
+    ),
+    (
+        129,
+        "wetland-stable-tree-cover-7m-trees",
+        "Stable tree cover - 7m trees",
+        False,
+        "4D989A",
+        (77, 152, 154),
+    ),
+    (
+        130,
+        "wetland-stable-tree-cover-8m-trees",
+        "Stable tree cover - 8m trees",
+        False,
+        "4B9597",
+        (75, 149, 151),
+    ),
+    (
+        131,
+        "wetland-stable-tree-cover-9m-trees",
+        "Stable tree cover - 9m trees",
+        False,
+        "499294",
+        (73, 146, 148),
+    ),
+    (
+        132,
+        "wetland-stable-tree-cover-10m-trees",
+        "Stable tree cover - 10m trees",
+        False,
+        "478F91",
+        (71, 143, 145),
+    ),
+    (
+        133,
+        "wetland-stable-tree-cover-11m-trees",
+        "Stable tree cover - 11m trees",
+        False,
+        "458B8F",
+        (69, 139, 143),
+    ),
+    (
+        134,
+        "wetland-stable-tree-cover-12m-trees",
+        "Stable tree cover - 12m trees",
+        False,
+        "43888C",
+        (67, 136, 140),
+    ),
+    (
+        135,
+        "wetland-stable-tree-cover-13m-trees",
+        "Stable tree cover - 13m trees",
+        False,
+        "418589",
+        (65, 133, 137),
+    ),
+    (
+        136,
+        "wetland-stable-tree-cover-14m-trees",
+        "Stable tree cover - 14m trees",
+        False,
+        "3F8286",
+        (63, 130, 134),
+    ),
+    (
+        137,
+        "wetland-stable-tree-cover-15m-trees",
+        "Stable tree cover - 15m trees",
+        False,
+        "3D7F84",
+        (61, 127, 132),
+    ),
+    (
+        138,
+        "wetland-stable-tree-cover-16m-trees",
+        "Stable tree cover - 16m trees",
+        False,
+        "3B7C81",
+        (59, 124, 129),
+    ),
+    (
+        139,
+        "wetland-stable-tree-cover-17m-trees",
+        "Stable tree cover - 17m trees",
+        False,
+        "39797E",
+        (57, 121, 126),
+    ),
+    (
+        140,
+        "wetland-stable-tree-cover-18m-trees",
+        "Stable tree cover - 18m trees",
+        False,
+        "37767B",
+        (55, 118, 123),
+    ),
+    (
+        141,
+        "wetland-stable-tree-cover-19m-trees",
+        "Stable tree cover - 19m trees",
+        False,
+        "357279",
+        (53, 114, 121),
+    ),
+    (
+        142,
+        "wetland-stable-tree-cover-20m-trees",
+        "Stable tree cover - 20m trees",
+        False,
+        "336F76",
+        (51, 111, 118),
+    ),
+    (
+        143,
+        "wetland-stable-tree-cover-21m-trees",
+        "Stable tree cover - 21m trees",
+        False,
+        "316C73",
+        (49, 108, 115),
+    ),
+    (
+        144,
+        "wetland-stable-tree-cover-22m-trees",
+        "Stable tree cover - 22m trees",
+        False,
+        "2F6970",
+        (47, 105, 112),
+    ),
+    (
+        145,
+        "wetland-stable-tree-cover-23m-trees",
+        "Stable tree cover - 23m trees",
+        False,
+        "2D666E",
+        (45, 102, 110),
+    ),
+    (
+        146,
+        "wetland-stable-tree-cover-24m-trees",
+        "Stable tree cover - 24m trees",
+        False,
+        "2B636B",
+        (43, 99, 107),
+    ),
+    (
+        147,
+        "wetland-stable-tree-cover-25m-trees",
+        "Stable tree cover - 25m trees",
+        False,
+        "296068",
+        (41, 96, 104),
+    ),
+    (
+        148,
+        "wetland-stable-tree-cover-25m-trees",
+        "Stable tree cover - >25m trees",
+        False,
+        "285D66",
+        (40, 93, 102),
+    ),
+    (
+        149,
+        "wetland-tree-cover-with-previous-disturbance-2020-height-3m-trees",
+        "Tree cover with previous disturbance (2020 height) - 3m trees",
+        False,
+        "bb93b0",
+        (187, 147, 176),
+    ),
+    (
+        150,
+        "wetland-tree-cover-with-previous-disturbance-2020-height-4m-trees",
+        "Tree cover with previous disturbance (2020 height) - 4m trees",
+        False,
+        "B78FAC",
+        (183, 143, 172),
+    ),
+    (
+        151,
+        "wetland-tree-cover-with-previous-disturbance-2020-height-5m-trees",
+        "Tree cover with previous disturbance (2020 height) - 5m trees",
+        False,
+        "B48CA9",
+        (180, 140, 169),
+    ),
+    (
+        152,
+        "wetland-tree-cover-with-previous-disturbance-2020-height-6m-trees",
+        "Tree cover with previous disturbance (2020 height) - 6m trees",
+        False,
+        "B189A6",
+        (177, 137, 166),
+    ),
+    (
+        153,
+        "wetland-tree-cover-with-previous-disturbance-2020-height-7m-trees",
+        "Tree cover with previous disturbance (2020 height) - 7m trees",
+        False,
+        "AE85A2",
+        (174, 133, 162),
+    ),
+    (
+        154,
+        "wetland-tree-cover-with-previous-disturbance-2020-height-8m-trees",
+        "Tree cover with previous disturbance (2020 height) - 8m trees",
+        False,
+        "AA829F",
+        (170, 130, 159),
+    ),
+    (
+        155,
+        "wetland-tree-cover-with-previous-disturbance-2020-height-9m-trees",
+        "Tree cover with previous disturbance (2020 height) - 9m trees",
+        False,
+        "A77F9C",
+        (167, 127, 156),
+    ),
+    (
+        156,
+        "wetland-tree-cover-with-previous-disturbance-2020-height-10m-trees",
+        "Tree cover with previous disturbance (2020 height) - 10m trees",
+        False,
+        "A47B99",
+        (164, 123, 153),
+    ),
+    (
+        157,
+        "wetland-tree-cover-with-previous-disturbance-2020-height-11m-trees",
+        "Tree cover with previous disturbance (2020 height) - 11m trees",
+        False,
+        "A17895",
+        (161, 120, 149),
+    ),
+    (
+        158,
+        "wetland-tree-cover-with-previous-disturbance-2020-height-12m-trees",
+        "Tree cover with previous disturbance (2020 height) - 12m trees",
+        False,
+        "9E7592",
+        (158, 117, 146),
+    ),
+    (
+        159,
+        "wetland-tree-cover-with-previous-disturbance-2020-height-13m-trees",
+        "Tree cover with previous disturbance (2020 height) - 13m trees",
+        False,
+        "9A718F",
+        (154, 113, 143),
+    ),
+    (
+        160,
+        "wetland-tree-cover-with-previous-disturbance-2020-height-14m-trees",
+        "Tree cover with previous disturbance (2020 height) - 14m trees",
+        False,
+        "976E8C",
+        (151, 110, 140),
+    ),
+    (
+        161,
+        "wetland-tree-cover-with-previous-disturbance-2020-height-15m-trees",
+        "Tree cover with previous disturbance (2020 height) - 15m trees",
+        False,
+        "946B88",
+        (148, 107, 136),
+    ),
+    (
+        162,
+        "wetland-tree-cover-with-previous-disturbance-2020-height-16m-trees",
+        "Tree cover with previous disturbance (2020 height) - 16m trees",
+        False,
+        "916885",
+        (145, 104, 133),
+    ),
+    (
+        163,
+        "wetland-tree-cover-with-previous-disturbance-2020-height-17m-trees",
+        "Tree cover with previous disturbance (2020 height) - 17m trees",
+        False,
+        "8D6482",
+        (141, 100, 130),
+    ),
+    (
+        164,
+        "wetland-tree-cover-with-previous-disturbance-2020-height-18m-trees",
+        "Tree cover with previous disturbance (2020 height) - 18m trees",
+        False,
+        "8A617F",
+        (138, 97, 127),
+    ),
+    (
+        165,
+        "wetland-tree-cover-with-previous-disturbance-2020-height-19m-trees",
+        "Tree cover with previous disturbance (2020 height) - 19m trees",
+        False,
+        "875E7B",
+        (135, 94, 123),
+    ),
+    (
+        166,
+        "wetland-tree-cover-with-previous-disturbance-2020-height-20m-trees",
+        "Tree cover with previous disturbance (2020 height) - 20m trees",
+        False,
+        "845A78",
+        (132, 90, 120),
+    ),
+    (
+        167,
+        "wetland-tree-cover-with-previous-disturbance-2020-height-21m-trees",
+        "Tree cover with previous disturbance (2020 height) - 21m trees",
+        False,
+        "815775",
+        (129, 87, 117),
+    ),
+    (
+        168,
+        "wetland-tree-cover-with-previous-disturbance-2020-height-22m-trees",
+        "Tree cover with previous disturbance (2020 height) - 22m trees",
+        False,
+        "7D5472",
+        (125, 84, 114),
+    ),
+    (
+        169,
+        "wetland-tree-cover-with-previous-disturbance-2020-height-23m-trees",
+        "Tree cover with previous disturbance (2020 height) - 23m trees",
+        False,
+        "7A506E",
+        (122, 80, 110),
+    ),
+    (
+        170,
+        "wetland-tree-cover-with-previous-disturbance-2020-height-24m-trees",
+        "Tree cover with previous disturbance (2020 height) - 24m trees",
+        False,
+        "774D6B",
+        (119, 77, 107),
+    ),
+    (
+        171,
+        "wetland-tree-cover-with-previous-disturbance-2020-height-25m-trees",
+        "Tree cover with previous disturbance (2020 height) - 25m trees",
+        False,
+        "744A68",
+        (116, 74, 104),
+    ),
+    (
+        172,
+        "wetland-tree-cover-with-previous-disturbance-2020-height-25m-trees",
+        "Tree cover with previous disturbance (2020 height) - >25m trees",
+        False,
+        "714765",
+        (113, 71, 101),
+    ),
+    (
+        173,
+        "wetland-tree-height-gain-2020-height-3m-trees",
+        "Tree height gain (2020 height) - 3m trees",
+        False,
+        "de7cbb",
+        (222, 124, 187),
+    ),
+    (
+        174,
+        "wetland-tree-height-gain-2020-height-4m-trees",
+        "Tree height gain (2020 height) - 4m trees",
+        False,
+        "DA77B7",
+        (218, 119, 183),
+    ),
+    (
+        175,
+        "wetland-tree-height-gain-2020-height-5m-trees",
+        "Tree height gain (2020 height) - 5m trees",
+        False,
+        "D772B3",
+        (215, 114, 179),
+    ),
+    (
+        176,
+        "wetland-tree-height-gain-2020-height-6m-trees",
+        "Tree height gain (2020 height) - 6m trees",
+        False,
+        "D46EAF",
+        (212, 110, 175),
+    ),
+    (
+        177,
+        "wetland-tree-height-gain-2020-height-7m-trees",
+        "Tree height gain (2020 height) - 7m trees",
+        False,
+        "D169AB",
+        (209, 105, 171),
+    ),
+    (
+        178,
+        "wetland-tree-height-gain-2020-height-8m-trees",
+        "Tree height gain (2020 height) - 8m trees",
+        False,
+        "CE64A8",
+        (206, 100, 168),
+    ),
+    (
+        179,
+        "wetland-tree-height-gain-2020-height-9m-trees",
+        "Tree height gain (2020 height) - 9m trees",
+        False,
+        "CB60A4",
+        (203, 96, 164),
+    ),
+    (
+        180,
+        "wetland-tree-height-gain-2020-height-10m-trees",
+        "Tree height gain (2020 height) - 10m trees",
+        False,
+        "C85BA0",
+        (200, 91, 160),
+    ),
+    (
+        181,
+        "wetland-tree-height-gain-2020-height-11m-trees",
+        "Tree height gain (2020 height) - 11m trees",
+        False,
+        "C4579C",
+        (196, 87, 156),
+    ),
+    (
+        182,
+        "wetland-tree-height-gain-2020-height-12m-trees",
+        "Tree height gain (2020 height) - 12m trees",
+        False,
+        "C15298",
+        (193, 82, 152),
+    ),
+    (
+        183,
+        "wetland-tree-height-gain-2020-height-13m-trees",
+        "Tree height gain (2020 height) - 13m trees",
+        False,
+        "BE4D95",
+        (190, 77, 149),
+    ),
+    (
+        184,
+        "wetland-tree-height-gain-2020-height-14m-trees",
+        "Tree height gain (2020 height) - 14m trees",
+        False,
+        "BB4991",
+        (187, 73, 145),
+    ),
+    (
+        185,
+        "wetland-tree-height-gain-2020-height-15m-trees",
+        "Tree height gain (2020 height) - 15m trees",
+        False,
+        "B8448D",
+        (184, 68, 141),
+    ),
+    (
+        186,
+        "wetland-tree-height-gain-2020-height-16m-trees",
+        "Tree height gain (2020 height) - 16m trees",
+        False,
+        "B54089",
+        (181, 64, 137),
+    ),
+    (
+        187,
+        "wetland-tree-height-gain-2020-height-17m-trees",
+        "Tree height gain (2020 height) - 17m trees",
+        False,
+        "B23B86",
+        (178, 59, 134),
+    ),
+    (
+        188,
+        "wetland-tree-height-gain-2020-height-18m-trees",
+        "Tree height gain (2020 height) - 18m trees",
+        False,
+        "AF3682",
+        (175, 54, 130),
+    ),
+    (
+        189,
+        "wetland-tree-height-gain-2020-height-19m-trees",
+        "Tree height gain (2020 height) - 19m trees",
+        False,
+        "AB327E",
+        (171, 50, 126),
+    ),
+    (
+        190,
+        "wetland-tree-height-gain-2020-height-20m-trees",
+        "Tree height gain (2020 height) - 20m trees",
+        False,
+        "A82D7A",
+        (168, 45, 122),
+    ),
+    (
+        191,
+        "wetland-tree-height-gain-2020-height-21m-trees",
+        "Tree height gain (2020 height) - 21m trees",
+        False,
+        "A52976",
+        (165, 41, 118),
+    ),
+    (
+        192,
+        "wetland-tree-height-gain-2020-height-22m-trees",
+        "Tree height gain (2020 height) - 22m trees",
+        False,
+        "A22473",
+        (162, 36, 115),
+    ),
+    (
+        193,
+        "wetland-tree-height-gain-2020-height-23m-trees",
+        "Tree height gain (2020 height) - 23m trees",
+        False,
+        "9F1F6F",
+        (159, 31, 111),
+    ),
+    (
+        194,
+        "wetland-tree-height-gain-2020-height-24m-trees",
+        "Tree height gain (2020 height) - 24m trees",
+        False,
+        "9C1B6B",
+        (156, 27, 107),
+    ),
+    (
+        195,
+        "wetland-tree-height-gain-2020-height-25m-trees",
+        "Tree height gain (2020 height) - 25m trees",
+        False,
+        "991667",
+        (153, 22, 103),
+    ),
+    (
+        196,
+        "wetland-tree-height-gain-2020-height-25m-trees",
+        "Tree height gain (2020 height) - >25m trees",
+        False,
+        "961264",
+        (150, 18, 100),
+    ),
+    (
+        208,
+        "open-surface-water-open-surface-water-permanent-water",
+        "Open surface water - permanent water",
+        False,
+        "0000BA",
+        (0, 0, 186),
+    ),
+    (
+        209,
+        "open-surface-water-open-surface-water-persistent-water-loss",
+        "Open surface water - persistent water loss",
+        False,
+        "040464",
+        (4, 4, 100),
+    ),
+    (
+        210,
+        "open-surface-water-open-surface-water-persistent-water-gain",
+        "Open surface water - persistent water gain",
+        False,
+        "0000FF",
+        (0, 0, 255),
+    ),
+    (
+        211,
+        "open-surface-water-open-surface-water-variable-water",
+        "Open surface water - variable water",
+        False,
+        "3051cf",
+        (48, 81, 207),
+    ),
+    (
+        240,
+        "short-vegetation-short-vegetation-short-vegetation-after-tree-loss",
+        "Short vegetation - short vegetation after tree loss",
+        False,
+        "ff2828",
+        (255, 40, 40),
+    ),
+    (
+        241,
+        "snow-ice-snow-ice-stable",
+        "Snow/ice - stable",
+        False,
+        "ffffff",
+        (255, 255, 255),
+    ),
+    (
+        242,
+        "snow-ice-snow-ice-snow-ice-gain",
+        "Snow/ice - snow/ice gain",
+        False,
+        "d0ffff",
+        (208, 255, 255),
+    ),
+    (
+        243,
+        "snow-ice-snow-ice-snow-ice-loss",
+        "Snow/ice - snow/ice loss",
+        False,
+        "ffe0d0",
+        (255, 224, 208),
+    ),
+    (
+        244,
+        "cropland-cropland-stable-cropland",
+        "Cropland - stable cropland",
+        False,
+        "ff7d00",
+        (255, 125, 0),
+    ),
+    (
+        245,
+        "cropland-cropland-cropland-gain-from-trees",
+        "Cropland - cropland gain from trees",
+        False,
+        "fac800",
+        (250, 200, 0),
+    ),
+    (
+        246,
+        "cropland-cropland-cropland-gain-from-wetland-veg",
+        "Cropland - cropland gain from wetland veg",
+        False,
+        "c86400",
+        (200, 100, 0),
+    ),
+    (
+        247,
+        "cropland-cropland-cropland-gain-from-other",
+        "Cropland - cropland gain from other",
+        False,
+        "fff000",
+        (255, 240, 0),
+    ),
+    (
+        248,
+        "cropland-loss-cropland-loss-cropland-loss-to-tree",
+        "Cropland loss - cropland loss to tree",
+        False,
+        "afcd96",
+        (175, 205, 150),
+    ),
+    (
+        249,
+        "cropland-loss-cropland-loss-cropland-loss-to-short-veg-other",
+        "Cropland loss - cropland loss to short veg/other",
+        False,
+        "afcd96",
+        (175, 205, 150),
+    ),
+    (
+        250,
+        "built-up-built-up-stable-built-up",
+        "Built-up - stable built-up",
+        False,
+        "64dcdc",
+        (100, 220, 220),
+    ),
+    (
+        251,
+        "built-up-built-up-built-up-gain-from-trees",
+        "Built-up - built-up gain from trees",
+        False,
+        "00ffff",
+        (0, 255, 255),
+    ),
+    (
+        252,
+        "built-up-built-up-built-up-gain-from-crop",
+        "Built-up - built-up gain from crop",
+        False,
+        "00ffff",
+        (0, 255, 255),
+    ),
+    (
+        253,
+        "built-up-built-up-built-up-from-other",
+        "Built-up - built-up from other",
+        False,
+        "00ffff",
+        (0, 255, 255),
+    ),
+    (
+        254,
+        "ocean-ocean",
+        "Ocean",
+        False,
+        "111133",
+        (17, 17, 51),
+    ),
+    (
+        255,
+        "no-data",
+        "",
+        True,
+        None,
+        None,
+    ),
+]
@@ -1,11 +1,16 @@
 import csv
+import re
+import string
+from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Annotated, Any, Dict, List, Optional, Union
+from types import MappingProxyType
+from typing import Annotated, Any, Callable, Dict, List, Mapping, Optional, Union
 
-from parse import Parser, Result, parse
+from parse import Parser, Result
 from pystac import (
     Asset,
     Collection,
@@ -34,7 +39,8 @@ from pystac.extensions.scientific import (
 )
 from rio_cogeo.cogeo import cog_validate
 from rio_stac.stac import bbox_to_geom, get_media_type, rasterio
-from slugify import slugify
+
+from stactools.glad_glclu2020.data._baked import ANNUAL, CHANGE, ClassificationRow
 
 DATA_DIR = Path(__file__).parent / "data"
 
@@ -76,9 +82,53 @@ COLLECTION_KEYWORDS = [
     "surface water",
 ]
 
+# static collection metadata, clone before attaching to a collection
+_COLLECTION_EXTENT = Extent(
+    SpatialExtent([list(COLLECTION_BBOX)]),
+    TemporalExtent(
+        [
+            [
+                COLLECTION_START_DATETIME,
+                COLLECTION_END_DATETIME,
+            ]
+        ]
+    ),
+)
+_THUMBNAIL_ASSET = Asset(
+    href=(
+        "https://glad.umd.edu/sites/default/files/styles/projects/public/datasets_glulc.jpg?itok=bxS-HPMi"
+    ),
+    media_type=MediaType.JPEG,
+    title="Thumbnail",
+    roles=["thumbnail"],
+)
+_STATIC_LINKS = [
+    Link(
+        rel=RelType.LICENSE,
+        target="https://creativecommons.org/licenses/by/4.0/",
+        media_type=MediaType.HTML,
+        title="CC-BY-4.0 license",
+    ),
+    Link(
+        rel="documentation",
+        target=COLLECTION_HOMEPAGE,
+        media_type=MediaType.HTML,
+        title="GLAD GLCLU Access Page",
+    ),
+    Link(
+        rel=ScientificRelType.CITE_AS,
+        target="https://doi.org/10.3389/frsen.2022.856903",
+    ),
+]
+
 RESOLUTION_METERS = 30
 VERSION = "v2"
 
+BAKED_CLASSIFICATIONS: Dict[Path, List[ClassificationRow]] = {
+    DATA_DIR / "annual_classes.csv": ANNUAL,
+    DATA_DIR / "change_classes.csv": CHANGE,
+}
+
 RENDER_EXT_URI = "https://stac-extensions.github.io/render/v1.0.0/schema.json"
 
 
@@ -93,23 +143,260 @@ HrefFormat = Annotated[str, "String format for the asset hrefs"]
 
 YEAR_FORMAT = "{year:4d}"
 CHANGE_YEAR_FORMAT = "{start_year:4d}-{end_year:4d}change"
+_CHANGE_YEAR_PARSER = Parser(CHANGE_YEAR_FORMAT)
 ASSET_NAME = "data"
 ASSET_ROLES = ["data"]
 
 
-def _get_media_type(asset_href: str) -> MediaType:
-    """Get media type for an asset href"""
-    valid_cog, _, _ = cog_validate(asset_href, quiet=True)
-    if valid_cog:
-        return MediaType.COG if valid_cog else MediaType.GEOTIFF
+# punctuation and whitespace become slug separators, quotes are dropped
+_SLUG_TRANS = str.maketrans(
+    {
+        **{c: "-" for c in string.punctuation + string.whitespace},
+        "'": None,
+        '"': None,
+    }
+)
+
+
+def _slugify(*parts: str) -> str:
+    """Slugify the ASCII classification fields like python-slugify would"""
+    slug = "__".join(parts).lower().translate(_SLUG_TRANS)
+    return "-".join(filter(None, slug.split("-")))
+
+
+def read_classifications_csv(classifications_file: Path) -> List[ClassificationRow]:
+    """Read classification rows from one of the classification CSV files.
+
+    Used at runtime only for files without baked data; scripts/bake-classifications
+    uses it to regenerate data/_baked.py.
+    """
+    rows: List[ClassificationRow] = []
+    with open(classifications_file, "r", newline="") as csvfile:
+        reader = csv.reader(csvfile, delimiter=",")
+        # the column order differs between the CSV files
+        header = next(reader)
+        value_idx, general_class_idx, class_idx, sub_class_idx, color_hint_idx = (
+            header.index(column)
+            for column in ["value", "general_class", "class", "sub_class", "color_hint"]
+        )
+        for row in reader:
+            # short rows are missing trailing empty fields
+            row += [""] * (len(header) - len(row))
+            value = int(row[value_idx])
+            sub_class = row[sub_class_idx]
+            color_hint = row[color_hint_idx].strip() or None
+            # convert hex to rgb
+            color = int(color_hint, 16) if color_hint else None
+            rows.append(
+                (
+                    value,
+                    _slugify(row[general_class_idx], row[class_idx], sub_class),
+                    (
+                        f"{row[class_idx]} - {sub_class}"
+                        if sub_class.strip()
+                        else row[class_idx]
+                    ),
+                    True if value == 255 else False,
+                    color_hint,
+                    (
+                        ((color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF)
+                        if color is not None
+                        else None
+                    ),
+                )
+            )
+
+    return rows
+
+
+def _remote_env() -> rasterio.Env:
+    """GDAL configuration for reading the raster headers of remote assets
+
+    Stops GDAL from listing directories and probing for sidecar files (.aux.xml,
+    .msk, .ovr) before every open, and merges/caches the range requests it makes.
+    """
+    return rasterio.Env(
+        GDAL_DISABLE_READDIR_ON_OPEN="EMPTY_DIR",
+        GDAL_HTTP_MERGE_CONSECUTIVE_RANGES="YES",
+        VSI_CACHE="TRUE",
+        VSI_CACHE_SIZE=str(32 * 1024 * 1024),
+    )
+
+
+def _looks_like_cog(src: rasterio.io.DatasetReader) -> bool:
+    """Check the already-read header for the COG layout or tiles plus overviews"""
+    if src.driver != "GTiff":
+        return False
 
-    with rasterio.open(asset_href) as src:
-        media_type: MediaType | None = get_media_type(src)
+    if src.tags(ns="IMAGE_STRUCTURE").get("LAYOUT") == "COG":
+        return True
+
+    return bool(src.profile.get("tiled")) and len(src.overviews(1)) > 0
+
+
+def _get_dataset_media_type(
+    src: rasterio.io.DatasetReader, strict: bool = False
+) -> MediaType:
+    """Get media type for an open raster, see _get_media_type"""
+    if not strict and _looks_like_cog(src):
+        return MediaType.COG
+
+    media_type: MediaType | None = get_media_type(src)
+    if not media_type:
+        raise ValueError(f"could not identify media type for {src.name}")
+
+    return media_type
+
+
+@lru_cache(maxsize=1024)
+def _get_media_type(asset_href: str, strict: bool = False) -> MediaType:
+    """Get media type for an asset href
+
+    By default COGs are identified from the raster header alone. With strict=True
+    the full rio-cogeo validation is run instead, which reads considerably more of
+    the file.
+
+    Results are cached per href, which assumes the assets are not replaced with
+    files in a different format while the process is running.
+    """
+    with _remote_env():
+        if strict:
+            valid_cog, _, _ = cog_validate(asset_href, quiet=True)
+            if valid_cog:
+                return MediaType.COG
+
+        with rasterio.open(asset_href) as src:
+            return _get_dataset_media_type(src, strict=strict)
+
+
+# the patterns parse uses for its string types, which all match to str values
+_HREF_FORMAT_STRING_TYPES = {
+    "": r".+?",
+    "w": r"\w+",
+    "W": r"\W+",
+    "s": r"\s+",
+    "S": r"\S+",
+    "l": r"[A-Za-z]+",
+}
+_HREF_FORMAT_TOKEN = re.compile(r"\{\{|\}\}|\{([^{}:]*)(?::([^{}]*))?\}")
+
+
+@lru_cache(maxsize=32)
+def _compile_href_format(href_format: str) -> re.Pattern[str]:
+    """Translate an href_format into a regular expression that matches hrefs the
+    same way parse would, e.g. "s3://bucket/{year}/{loc}.tif" becomes
+    "s3://bucket/(?P<year>.+?)/(?P<loc>.+?)\\.tif"
+
+    Cached because validation, every collection definition and the registry all
+    compile the same href_format.
+    """
+    pattern = ""
+    names = set()
+    position = 0
+    for token in _HREF_FORMAT_TOKEN.finditer(href_format):
+        pattern += re.escape(href_format[position : token.start()])
+        position = token.end()
+
+        if token.group(0) in ("{{", "}}"):
+            pattern += re.escape(token.group(0)[0])
+            continue
+
+        name, spec = token.group(1), token.group(2) or ""
+        if spec in _HREF_FORMAT_STRING_TYPES:
+            field_pattern = _HREF_FORMAT_STRING_TYPES[spec]
+        elif spec.endswith("d"):
+            field_pattern = r"\d+"
+        else:
+            raise ValueError(
+                f"Unsupported href_format field: {token.group(0)}. Only plain fields "
+                "(e.g. {loc}), the parse string types w, W, s, S and l (e.g. "
+                "{loc:w}) and integer fields (e.g. {year:d}) are supported"
+            )
+
+        if not name:
+            pattern += f"(?:{field_pattern})"
+        elif not name.isidentifier():
+            raise ValueError(f"Unsupported href_format field name: {name}")
+        elif name in names:
+            # repeated fields must match the same text each time
+            pattern += f"(?P={name})"
+        else:
+            names.add(name)
+            pattern += f"(?P<{name}>{field_pattern})"
+
+    pattern += re.escape(href_format[position:])
+
+    return re.compile(pattern, re.IGNORECASE | re.DOTALL)
+
+
+def _parse_href(
+    href: str, href_format: str, href_re: re.Pattern[str]
+) -> Union[None, Dict[str, Any]]:
+    """Parse the item ID, collection and datetimes from an asset href"""
+    parsed = href_re.fullmatch(href)
+    if parsed is None:
+        raise ValueError(
+            f"could not parse the provided href ({href}) using the provided "
+            f"href_format: {href_format}"
+        )
 
-        if not media_type:
-            raise ValueError(f"could not identify media type for {asset_href}")
+    # only the change format contains "change", so at most one parse is needed
+    # (hrefs match case-insensitively, so "CHANGE" counts too)
+    named = parsed.groupdict()
+    year_str = named["year"]
+    year_parsed = (
+        _CHANGE_YEAR_PARSER.parse(year_str) if "change" in year_str.lower() else None
+    )
+    if isinstance(year_parsed, Result):
+        collection_id = CollectionIDs.GLAD_GLCLU2020_CHANGE.value
+        datetime_properties = {
+            "start_datetime": datetime(
+                year=int(year_parsed.named["start_year"]),
+                month=1,
+                day=1,
+                tzinfo=timezone.utc,
+            ),
+            "end_datetime": datetime(
+                year=int(year_parsed.named["end_year"]),
+                month=12,
+                day=31,
+                hour=23,
+                minute=59,
+                second=59,
+                tzinfo=timezone.utc,
+            ),
+            "datetime": datetime(
+                year=int(
+                    year_parsed.named["end_year"],
+                ),
+                month=1,
+                day=1,
+                tzinfo=timezone.utc,
+            ),
+        }
+    elif year_str.isascii() and year_str.isdigit() and len(year_str) == 4:
+        collection_id = CollectionIDs.GLAD_GLCLU2020.value
+        datetime_properties = {
+            "datetime": datetime(
+                year=int(year_str),
+                month=1,
+                day=1,
+                tzinfo=timezone.utc,
+            ),
+        }
+    else:
+        raise ValueError(
+            "The year parameter cannot be parsed into either the annual or change "
+            f"formats: {year_str}\n"
+            "Make sure the year parameter matches either of these formats:\n"
+            + ", ".join([YEAR_FORMAT, CHANGE_YEAR_FORMAT])
+        )
 
-        return media_type
+    return {
+        "id": "_".join(named.values()),
+        "collection": collection_id,
+        **datetime_properties,
+    }
 
 
 @dataclass
@@ -129,41 +416,37 @@ class CollectionDefinition:
         DEFAULT_HREF_FORMAT
     )
 
-    # Cached properties
-    _classifications: Optional[List[Classification]] = field(init=False, default=None)
+    _href_re: re.Pattern[str] = field(init=False, repr=False)
 
-    @property
+    def __post_init__(self) -> None:
+        self._href_re = _compile_href_format(self.href_format)
+
+    @cached_property
     def classifications(self) -> List[Classification]:
-        """Lazy load classifications from CSV."""
-        if self._classifications is None:
-            self._classifications = self._load_classifications()
-        return self._classifications
+        """Lazy load classifications from the baked data (or CSV)."""
+        return self._load_classifications()
 
-    def _load_classifications(self) -> List[Classification]:
-        classifications = []
-        with open(self.classifications_file, "r", newline="") as csvfile:
-            reader = csv.DictReader(csvfile, delimiter=",")
-            for row in reader:
-                entry = Classification.create(
-                    value=int(row["value"]),
-                    name=slugify(
-                        "__".join(
-                            [row["general_class"], row["class"], row["sub_class"]]
-                        )
-                    ),
-                    description=(
-                        f"{row['class']} - {row['sub_class']}"
-                        if row["sub_class"].strip()
-                        else row["class"]
-                    ),
-                    nodata=True if int(row["value"]) == 255 else False,
-                    color_hint=row["color_hint"].strip() if row["color_hint"] else None,
-                )
-                classifications.append(entry)
+    def _classification_rows(self) -> List[ClassificationRow]:
+        rows = BAKED_CLASSIFICATIONS.get(self.classifications_file)
+        if rows is None:
+            rows = read_classifications_csv(self.classifications_file)
+        return rows
 
-        return classifications
+    def _load_classifications(self) -> List[Classification]:
+        return [
+            Classification.create(
+                value=value,
+                name=name,
+                description=description,
+                nodata=nodata,
+                color_hint=color_hint,
+            )
+            for value, name, description, nodata, color_hint, _ in (
+                self._classification_rows()
+            )
+        ]
 
-    @property
+    @cached_property
     def item_assets(self) -> Dict[str, AssetDefinition]:
         asset_definition = AssetDefinition.create(
             roles=ASSET_ROLES,
@@ -176,7 +459,7 @@ class CollectionDefinition:
 
         return {ASSET_NAME: asset_definition}
 
-    @property
+    @cached_property
     def renders(self) -> Dict[str, Any]:
         """Set up render keys for each unique datetime in the collection"""
         datetimes = (
@@ -192,12 +475,9 @@ class CollectionDefinition:
                 "assets": [ASSET_NAME],
                 "datetime": datetime_str,
                 "colormap": {
-                    # convert hex to rgb
-                    classification.value: tuple(
-                        int(classification.color_hint[i : i + 2], 16) for i in (0, 2, 4)
-                    )
-                    for classification in self.classifications
-                    if classification.color_hint
+                    value: rgb
+                    for value, _, _, _, _, rgb in self._classification_rows()
+                    if rgb
                 },
             }
             for year, datetime_str in datetimes
@@ -207,6 +487,7 @@ class CollectionDefinition:
         self,
         media_type: Optional[MediaType] = None,
         sample_asset_href: Optional[str] = None,
+        strict_media_type: bool = False,
     ) -> Collection:
         """Build Collection object"""
         if not (sample_asset_href or media_type):
@@ -216,27 +497,21 @@ class CollectionDefinition:
             )
 
         if not media_type and sample_asset_href:
-            media_type = _get_media_type(sample_asset_href)
+            media_type = _get_media_type(sample_asset_href, strict=strict_media_type)
 
-        assets = self.item_assets
+        # copy the cached definitions so the collection can be modified freely
+        assets = {
+            name: AssetDefinition(asset_definition.to_dict())
+            for name, asset_definition in self.item_assets.items()
+        }
         assets[ASSET_NAME].media_type = media_type
 
         collection = Collection(
             id=self.id.value,
             title=self.title,
             description=self.description,
-            extent=Extent(
-                SpatialExtent([list(COLLECTION_BBOX)]),
-                TemporalExtent(
-                    [
-                        [
-                            COLLECTION_START_DATETIME,
-                            COLLECTION_END_DATETIME,
-                        ]
-                    ]
-                ),
-            ),
-            extra_fields={"renders": self.renders},
+            extent=_COLLECTION_EXTENT.clone(),
+            extra_fields={"renders": deepcopy(self.renders)},
             keywords=COLLECTION_KEYWORDS,
             license="CC-BY-4.0",
             providers=[
@@ -251,16 +526,7 @@ class CollectionDefinition:
                     ],
                 ),
             ],
-            assets={
-                "thumbnail": Asset(
-                    href=(
-                        "https://glad.umd.edu/sites/default/files/styles/projects/public/datasets_glulc.jpg?itok=bxS-HPMi"
-                    ),
-                    media_type=MediaType.JPEG,
-                    title="Thumbnail",
-                    roles=["thumbnail"],
-                )
-            },
+            assets={"thumbnail": _THUMBNAIL_ASSET.clone()},
             stac_extensions=[
                 PROJ_EXT_URI,
                 RENDER_EXT_URI,
@@ -278,93 +544,13 @@ class CollectionDefinition:
         item_assets_ext = ItemAssetsExtension.ext(collection, add_if_missing=True)
         item_assets_ext.item_assets = assets
 
-        # add links
-        links = [
-            Link(
-                rel=RelType.LICENSE,
-                target="https://creativecommons.org/licenses/by/4.0/",
-                media_type=MediaType.HTML,
-                title="CC-BY-4.0 license",
-            ),
-            Link(
-                rel="documentation",
-                target=COLLECTION_HOMEPAGE,
-                media_type=MediaType.HTML,
-                title="GLAD GLCLU Access Page",
-            ),
-            Link(
-                rel=ScientificRelType.CITE_AS,
-                target="https://doi.org/10.3389/frsen.2022.856903",
-            ),
-        ]
-        collection.add_links(links)
+        # add links, cloned because pystac sets their owner
+        collection.add_links([link.clone() for link in _STATIC_LINKS])
 
         return collection
 
     def parse_href(self, href: str) -> Union[None, Dict[str, Any]]:
-        parsed = parse(self.href_format, href)
-        if not isinstance(parsed, Result):
-            raise ValueError(
-                f"could not parse the provided href ({href}) using the provided "
-                f"href_format: {self.href_format}"
-            )
-
-        if year_parsed := parse(CHANGE_YEAR_FORMAT, parsed.named["year"]):
-            if not isinstance(year_parsed, Result):
-                return None
-
-            collection_id = CollectionIDs.GLAD_GLCLU2020_CHANGE.value
-            datetime_properties = {
-                "start_datetime": datetime(
-                    year=int(year_parsed.named["start_year"]),
-                    month=1,
-                    day=1,
-                    tzinfo=timezone.utc,
-                ),
-                "end_datetime": datetime(
-                    year=int(year_parsed.named["end_year"]),
-                    month=12,
-                    day=31,
-                    hour=23,
-                    minute=59,
-                    second=59,
-                    tzinfo=timezone.utc,
-                ),
-                "datetime": datetime(
-                    year=int(
-                        year_parsed.named["end_year"],
-                    ),
-                    month=1,
-                    day=1,
-                    tzinfo=timezone.utc,
-                ),
-            }
-        elif year_parsed := parse(YEAR_FORMAT, parsed.named["year"]):
-            if not isinstance(year_parsed, Result):
-                return None
-
-            collection_id = CollectionIDs.GLAD_GLCLU2020.value
-            datetime_properties = {
-                "datetime": datetime(
-                    year=int(year_parsed.named["year"]),
-                    month=1,
-                    day=1,
-                    tzinfo=timezone.utc,
-                ),
-            }
-        else:
-            raise ValueError(
-                "The year parameter cannot be parsed into either the annual or change "
-                f"formats: {parsed.named['year']}\n"
-                "Make sure the year parameter matches either of these formats:\n"
-                + ", ".join([YEAR_FORMAT, CHANGE_YEAR_FORMAT])
-            )
-
-        return {
-            "id": "_".join(parsed.named.values()),
-            "collection": collection_id,
-            **datetime_properties,
-        }
+        return _parse_href(href, self.href_format, self._href_re)
 
     def create_item(self, asset_href: str) -> Item:
         """Creates a STAC item from a raster asset."""
@@ -372,10 +558,17 @@ class CollectionDefinition:
         if not href_parsed:
             raise ValueError(f"Unable to parse href: {asset_href}")
 
-        id = href_parsed.pop("id")
-        collection = href_parsed.pop("collection")
-        media_type = _get_media_type(asset_href)
-        with rasterio.open(asset_href) as src:
+        return self._build_item_from_parsed(asset_href, href_parsed)
+
+    def _build_item_from_parsed(
+        self, asset_href: str, href_parsed: Dict[str, Any]
+    ) -> Item:
+        """Creates a STAC item from a raster asset and its parse_href result."""
+        id = href_parsed["id"]
+        collection = href_parsed["collection"]
+        # a single open serves the media type, geometry and extension metadata
+        with _remote_env(), rasterio.open(asset_href) as src:
+            media_type = _get_dataset_media_type(src)
             data_asset = Asset(
                 href=asset_href,
                 title=self.asset_title,
@@ -452,6 +645,9 @@ def validate_href_format(href_format: str) -> str:
 
     found_params = set(parser.named_fields)
 
+    # hrefs are matched with a regular expression compiled from the format
+    _compile_href_format(href_format)
+
     missing = required_params - found_params
     if missing:
         raise ValueError(
@@ -467,13 +663,21 @@ class CollectionRegistry:
     """Registry of collection configurations."""
 
     href_format: HrefFormat = DEFAULT_HREF_FORMAT
-    configs: Dict[CollectionIDs, CollectionDefinition] = field(init=False)
+    _factories: Dict[CollectionIDs, Callable[[], CollectionDefinition]] = field(
+        init=False, repr=False
+    )
+    _configs: Dict[CollectionIDs, CollectionDefinition] = field(
+        init=False, repr=False, default_factory=dict
+    )
+    _href_re: re.Pattern[str] = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         self.href_format = validate_href_format(self.href_format)
+        self._href_re = _compile_href_format(self.href_format)
 
-        self.configs = {
-            CollectionIDs.GLAD_GLCLU2020: CollectionDefinition(
+        # collection definitions are only created once they are needed
+        self._factories = {
+            CollectionIDs.GLAD_GLCLU2020: lambda: CollectionDefinition(
                 id=CollectionIDs.GLAD_GLCLU2020,
                 title="GLAD: Annual maps of land cover and land use",
                 description=COLLECTION_DESCRIPTION,
@@ -486,7 +690,7 @@ class CollectionRegistry:
                 classifications_file=DATA_DIR / "annual_classes.csv",
                 href_format=self.href_format,
             ),
-            CollectionIDs.GLAD_GLCLU2020_CHANGE: CollectionDefinition(
+            CollectionIDs.GLAD_GLCLU2020_CHANGE: lambda: CollectionDefinition(
                 id=CollectionIDs.GLAD_GLCLU2020_CHANGE,
                 title="GLAD: Net change of land cover and land use between 2000 and "
                 "2020",
@@ -502,8 +706,24 @@ class CollectionRegistry:
             ),
         }
 
+    @property
+    def configs(self) -> Mapping[CollectionIDs, CollectionDefinition]:
+        """Read-only view of every collection definition, creating any that have not
+        been needed yet"""
+        for collection_id in self._factories:
+            self.get_config(collection_id)
+
+        return MappingProxyType(self._configs)
+
     def get_config(self, collection_id: CollectionIDs) -> CollectionDefinition:
-        if collection_id not in self.configs:
+        if collection_id not in self._factories:
             raise ValueError(f"Unknown collection ID: {collection_id}")
 
-        return self.configs[collection_id]
+        if collection_id not in self._configs:
+            self._configs[collection_id] = self._factories[collection_id]()
+
+        return self._configs[collection_id]
+
+    def parse_href(self, href: str) -> Union[None, Dict[str, Any]]:
+        """Parse an asset href without creating any collection definitions"""
+        return _parse_href(href, self.href_format, self._href_re)
@@ -1,4 +1,7 @@
-from typing import Optional
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Iterable, Iterator, Optional
 
 from pystac import (
     Collection,
@@ -33,11 +36,25 @@ s3://bucket/GLCLU2000-2020/{version}/{year}/{loc}.tif) that can be used to parse
 item ID information from the href.
 """
 
+CREATE_ITEMS_DESCRIPTION = """Generate item metadata for every asset href listed in a
+text file (one href per line), e.g. the lists published on the dataset homepage
+(https://storage.googleapis.com/earthenginepartners-hansen/GLCLU2000-2020/v2/2020.txt).
+The assets are read concurrently and each item is written to the destination
+directory as {item_id}.json. The href_format is applied to every href in the list.
+"""
+
+
+@lru_cache(maxsize=None)
+def _get_registry(href_format: HrefFormat = DEFAULT_HREF_FORMAT) -> CollectionRegistry:
+    """Get the (cached) collection registry for an href_format"""
+    return CollectionRegistry(href_format=href_format)
+
 
 def create_collection(
     id: CollectionIDs,
     media_type: Optional[MediaType] = None,
     sample_asset_href: Optional[str] = None,
+    strict_media_type: bool = False,
 ) -> Collection:
     f"""Creates a STAC Collection.
 
@@ -48,13 +65,14 @@ def create_collection(
         media_type: The media type of the assets (usually MediaType.COG or
             Mediatype.GEOTIFF)
         sample_asset_href: A sample asset href to use for identifying the media type
+        strict_media_type: Run the full rio-cogeo validation on sample_asset_href
+            instead of identifying COGs from the raster header
     Returns:
         Collection: STAC Collection object
     """
-    collections = CollectionRegistry()
-    config = collections.get_config(id)
+    config = _get_registry().get_config(id)
 
-    return config.build_collection(media_type, sample_asset_href)
+    return config.build_collection(media_type, sample_asset_href, strict_media_type)
 
 
 def create_item(asset_href: str, href_format: HrefFormat = DEFAULT_HREF_FORMAT) -> Item:
@@ -74,9 +92,54 @@ def create_item(asset_href: str, href_format: HrefFormat = DEFAULT_HREF_FORMAT)
     Returns:
         Item: STAC Item object
     """
-    registry = CollectionRegistry(href_format=href_format)
-    for config in registry.configs.values():
-        if config.parse_href(asset_href):
-            return config.create_item(asset_href)
+    registry = _get_registry(href_format)
+    href_parsed = registry.parse_href(asset_href)
+    if not href_parsed:
+        raise ValueError(f"No matching collection found for href: {asset_href}")
+
+    config = registry.get_config(CollectionIDs(href_parsed["collection"]))
+    return config._build_item_from_parsed(asset_href, href_parsed)
+
 
-    raise ValueError(f"No matching collection found for href: {asset_href}")
+def create_items(
+    asset_hrefs: Iterable[str],
+    href_format: HrefFormat = DEFAULT_HREF_FORMAT,
+    max_workers: Optional[int] = None,
+) -> Iterator[Item]:
+    """Creates STAC items from many asset hrefs.
+
+    Reading the assets is I/O bound, so the items are created concurrently in a
+    thread pool.
+
+    Args:
+        asset_hrefs (Iterable[str]): The asset hrefs from which to create the items
+        href_format (str): The string format that can be used to parse the
+            asset_hrefs
+        max_workers (Optional[int]): Number of threads to use, defaults to four per
+            CPU (up to 32)
+
+    Returns:
+        Iterator[Item]: STAC Item objects, in the same order as asset_hrefs
+    """
+    # not a generator itself, so a bad href_format fails here rather than on the
+    # first next()
+    _get_registry(href_format)
+
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+
+    return _create_items(asset_hrefs, href_format, max_workers)
+
+
+def _create_items(
+    asset_hrefs: Iterable[str], href_format: HrefFormat, max_workers: int
+) -> Iterator[Item]:
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        yield from executor.map(
+            partial(create_item, href_format=href_format), asset_hrefs
+        )
+    finally:
+        # when an item fails or the caller stops iterating, drop the hrefs that
+        # have not been started instead of waiting for the whole batch
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -1,3 +1,6 @@
+import functools
+
 from stactools.testing.test_data import TestData
 
 test_data = TestData(__file__)
+get_path = functools.lru_cache(maxsize=None)(test_data.get_path)
@@ -0,0 +1,144 @@
+import json
+from functools import lru_cache
+from hashlib import blake2b
+from pathlib import Path
+from typing import Callable, Dict, Optional, Set, Tuple
+
+import numpy as np
+import pystac
+import pystac.validation
+import pytest
+import rasterio
+from click.testing import CliRunner
+from pystac import Collection, MediaType, STACObject
+from pystac.validation import JsonSchemaSTACValidator
+from rasterio.transform import from_origin
+
+from stactools.glad_glclu2020 import stac
+from stactools.glad_glclu2020.metadata import CollectionIDs
+
+SCHEMAS_DIR = Path(__file__).parent / "schemas"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def local_schema_validator() -> JsonSchemaSTACValidator:
+    """Validate against the extension schemas in tests/schemas, which
+    scripts/download-schemas fills. Any schema missing there is fetched as usual."""
+    validator = JsonSchemaSTACValidator()
+    for path in SCHEMAS_DIR.glob("**/*.json"):
+        schema_uri = f"https://{path.relative_to(SCHEMAS_DIR).as_posix()}"
+        validator.schema_cache[schema_uri] = json.loads(path.read_text())
+    pystac.validation.set_validator(validator)
+    return validator
+
+
+@pytest.fixture(scope="session")
+def validate_once() -> Callable[[STACObject], None]:
+    """Validate a STAC object, skipping objects whose content has already passed"""
+    validated: Set[bytes] = set()
+
+    def validate(stac_object: STACObject) -> None:
+        stac_dict = stac_object.to_dict(include_self_link=False)
+        digest = blake2b(json.dumps(stac_dict, sort_keys=True).encode()).digest()
+        if digest not in validated:
+            # what STACObject.validate does, minus serializing the object again
+            pystac.validation.validate_dict(
+                stac_dict,
+                stac_object_type=stac_object.STAC_OBJECT_TYPE,
+                stac_version=pystac.get_stac_version(),
+                extensions=stac_object.stac_extensions,
+            )
+            validated.add(digest)
+
+    return validate
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def collection_factory() -> Callable[..., Collection]:
+    """Create each distinct collection once, handing out a fresh copy every time so
+    tests can modify it"""
+
+    @lru_cache(maxsize=None)
+    def _build(
+        id: CollectionIDs,
+        media_type: Optional[MediaType],
+        sample_asset_href: Optional[str],
+    ) -> Collection:
+        return stac.create_collection(
+            id, media_type=media_type, sample_asset_href=sample_asset_href
+        )
+
+    def factory(
+        id: CollectionIDs,
+        media_type: Optional[MediaType] = None,
+        sample_asset_href: Optional[str] = None,
+    ) -> Collection:
+        return Collection.from_dict(_build(id, media_type, sample_asset_href).to_dict())
+
+    return factory
+
+
+@pytest.fixture(scope="session")
+def sample_assets_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return tmp_path_factory.mktemp("data-files")
+
+
+@pytest.fixture(scope="session")
+def sample_asset_hrefs(sample_assets_root: Path) -> Dict[Tuple[str, str], str]:
+    """1x1 pixel stand-ins for data/{format}/v2/{year}/40N_080W.tif under
+    sample_assets_root, keyed by (format, year)
+
+    Item and collection creation only read the raster header, so these keep the
+    georeferencing of the real 40N_080W tile without its pixels.
+    """
+    hrefs = {}
+    for format, driver in [("geotiff", "GTiff"), ("cog", "COG")]:
+        for year in ["2000", "2000-2020change"]:
+            path = sample_assets_root / "data" / format / "v2" / year / "40N_080W.tif"
+            path.parent.mkdir(parents=True)
+            with rasterio.open(
+                path,
+                "w",
+                driver=driver,
+                width=1,
+                height=1,
+                count=1,
+                dtype="uint8",
+                crs="EPSG:4326",
+                transform=from_origin(-80.0, 40.0, 10.0, 10.0),
+            ) as dst:
+                dst.write(np.zeros((1, 1, 1), dtype="uint8"))
+            hrefs[format, year] = str(path)
+    return hrefs
+
+
+@pytest.fixture(scope="session")
+def overview_geotiff_href(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """A tiled GeoTIFF with internal overviews that was not written as a COG
+
+    Its header looks like a COG (tiles plus overviews, but no LAYOUT=COG), while
+    the overviews come after the full resolution data so it fails COG validation.
+    """
+    path = tmp_path_factory.mktemp("overviews") / "40N_080W.tif"
+    with rasterio.open(
+        path,
+        "w",
+        driver="GTiff",
+        width=64,
+        height=64,
+        count=1,
+        dtype="uint8",
+        crs="EPSG:4326",
+        transform=from_origin(-80.0, 40.0, 0.15625, 0.15625),
+        tiled=True,
+        blockxsize=16,
+        blockysize=16,
+    ) as dst:
+        dst.write(np.zeros((1, 64, 64), dtype="uint8"))
+        dst.build_overviews([2])
+    return str(path)
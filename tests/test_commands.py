@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import List
 
 import pytest
 from click import Group
@@ -6,26 +7,34 @@ from click.testing import CliRunner
 from pystac import Collection, Item, MediaType
 
 from stactools.glad_glclu2020.commands import create_gladglclu2020_command
-from stactools.glad_glclu2020.metadata import ASSET_NAME
+from stactools.glad_glclu2020.metadata import ASSET_NAME, CollectionIDs
 
-from . import test_data
+from . import get_path
 
 command = create_gladglclu2020_command(Group())
 
 
 @pytest.mark.parametrize(
-    ["collection_type", "media_type"],
+    ["collection_type", "collection_id", "media_type_option", "media_type"],
     [
-        (collection_type, media_type)
-        for collection_type in ["annual", "change"]
+        (collection_type, collection_id, option, media_type)
+        for collection_type, collection_id in [
+            ("annual", CollectionIDs.GLAD_GLCLU2020),
+            ("change", CollectionIDs.GLAD_GLCLU2020_CHANGE),
+        ]
         for media_type in [MediaType.COG, MediaType.GEOTIFF]
+        for option in [media_type.value, media_type.value.upper()]
     ],
 )  # type: ignore
 def test_create_collection_from_media_type(
-    tmp_path: Path, collection_type: str, media_type: MediaType
+    runner: CliRunner,
+    tmp_path: Path,
+    collection_type: str,
+    collection_id: CollectionIDs,
+    media_type_option: str,
+    media_type: MediaType,
 ) -> None:
     path = str(tmp_path / "collection.json")
-    runner = CliRunner()
     result = runner.invoke(
         command,
         [
@@ -33,15 +42,35 @@ def test_create_collection_from_media_type(
             "--type",
             collection_type,
             "--media-type",
-            media_type,
+            media_type_option,
             path,
         ],
     )
     assert result.exit_code == 0, "\n{}".format(result.output)
     collection = Collection.from_file(path)
+    assert collection.id == collection_id
+    # the option is case-insensitive but the canonical media type is written
+    assert collection.ext.item_assets[ASSET_NAME].media_type == media_type
     collection.validate()
 
 
+def test_create_collection_bad_media_type(runner: CliRunner, tmp_path: Path) -> None:
+    path = str(tmp_path / "collection.json")
+    result = runner.invoke(
+        command,
+        [
+            "create-collection",
+            "--type",
+            "annual",
+            "--media-type",
+            "image/tif",
+            path,
+        ],
+    )
+    assert result.exit_code == 2
+    assert "Invalid value for '--media-type'" in result.output
+
+
 @pytest.mark.parametrize(
     [
         "collection_type",
@@ -51,7 +80,7 @@ def test_create_collection_from_media_type(
     [
         (
             collection_type,
-            test_data.get_path(f"data/{format}/v2/{year}/40N_080W.tif"),
+            get_path(f"data/{format}/v2/{year}/40N_080W.tif"),
             media_type,
         )
         for collection_type in ["annual", "change"]
@@ -63,10 +92,13 @@ def test_create_collection_from_media_type(
     ],
 )  # type: ignore
 def test_create_collection_from_sample_asset_href(
-    tmp_path: Path, collection_type: str, sample_asset_href: str, media_type: MediaType
+    runner: CliRunner,
+    tmp_path: Path,
+    collection_type: str,
+    sample_asset_href: str,
+    media_type: MediaType,
 ) -> None:
     path = str(tmp_path / "collection.json")
-    runner = CliRunner()
     result = runner.invoke(
         command,
         [
@@ -88,7 +120,7 @@ def test_create_collection_from_sample_asset_href(
     ["asset_href", "year", "media_type"],
     [
         (
-            test_data.get_path(f"data/{format}/v2/{year}/40N_080W.tif"),
+            get_path(f"data/{format}/v2/{year}/40N_080W.tif"),
             year,
             media_type,
         )
@@ -100,7 +132,7 @@ def test_create_collection_from_sample_asset_href(
     ],
 )  # type: ignore
 def test_create_item(
-    tmp_path: Path, asset_href: str, year: str, media_type: MediaType
+    runner: CliRunner, tmp_path: Path, asset_href: str, year: str, media_type: MediaType
 ) -> None:
     version, loc = "v2", "40N_080W"
     test_href_format = (
@@ -109,7 +141,6 @@ def test_create_item(
         .replace(loc, "{loc}")
     )
     path = str(tmp_path / "item.json")
-    runner = CliRunner()
     result = runner.invoke(
         command, ["create-item", "--href-format", test_href_format, asset_href, path]
     )
@@ -119,10 +150,40 @@ def test_create_item(
     item.validate()
 
 
-def test_create_collection_no_media_type_or_sample(tmp_path: Path) -> None:
+@pytest.mark.parametrize(
+    ["strict_args", "media_type"],
+    [([], MediaType.COG), (["--strict-media-type"], MediaType.GEOTIFF)],
+)  # type: ignore
+def test_create_collection_strict_media_type(
+    runner: CliRunner,
+    tmp_path: Path,
+    overview_geotiff_href: str,
+    strict_args: List[str],
+    media_type: MediaType,
+) -> None:
+    path = str(tmp_path / "collection.json")
+    result = runner.invoke(
+        command,
+        [
+            "create-collection",
+            "--type",
+            "annual",
+            "--sample-asset-href",
+            overview_geotiff_href,
+            *strict_args,
+            path,
+        ],
+    )
+    assert result.exit_code == 0, "\n{}".format(result.output)
+    collection = Collection.from_file(path)
+    assert collection.ext.item_assets[ASSET_NAME].media_type == media_type
+
+
+def test_create_collection_no_media_type_or_sample(
+    runner: CliRunner, tmp_path: Path
+) -> None:
     """Test warning if no media_type or sample_asset_href provided"""
     path = str(tmp_path / "collection.json")
-    runner = CliRunner()
     with pytest.warns(UserWarning, match="No sample_asset_href or media_type provided"):
         result = runner.invoke(
             command,
@@ -134,3 +195,27 @@ def test_create_collection_no_media_type_or_sample(tmp_path: Path) -> None:
             ],
         )
     assert result.exit_code == 0, "\n{}".format(result.output)
+
+
+def test_create_items(runner: CliRunner, tmp_path: Path) -> None:
+    asset_hrefs = [
+        get_path(f"data/cog/v2/{year}/40N_080W.tif")
+        for year in ["2000", "2000-2020change"]
+    ]
+    href_format = get_path("data/cog/{version}/{year}/{loc}.tif")
+    sources = tmp_path / "sources.txt"
+    sources.write_text("\n".join(asset_hrefs) + "\n")
+    result = runner.invoke(
+        command,
+        [
+            "create-items",
+            "--href-format",
+            href_format,
+            str(sources),
+            str(tmp_path),
+        ],
+    )
+    assert result.exit_code == 0, "\n{}".format(result.output)
+    for item_id in ["v2_2000_40N_080W", "v2_2000-2020change_40N_080W"]:
+        item = Item.from_file(str(tmp_path / f"{item_id}.json"))
+        item.validate()
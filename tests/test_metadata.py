@@ -0,0 +1,119 @@
+from pathlib import Path
+from typing import Dict, Optional
+
+import pytest
+from pystac import MediaType
+
+from stactools.glad_glclu2020.metadata import (
+    BAKED_CLASSIFICATIONS,
+    CollectionIDs,
+    CollectionRegistry,
+    _compile_href_format,
+    _get_media_type,
+    read_classifications_csv,
+)
+
+from . import get_path
+
+
+@pytest.mark.parametrize(
+    "classifications_file", list(BAKED_CLASSIFICATIONS)
+)  # type: ignore
+def test_baked_classifications_match_csv(classifications_file: Path) -> None:
+    # regenerate with scripts/bake-classifications if the CSVs change
+    assert BAKED_CLASSIFICATIONS[classifications_file] == read_classifications_csv(
+        classifications_file
+    )
+
+
+@pytest.mark.parametrize(
+    ["asset_href", "media_type"],
+    [
+        (get_path("data/geotiff/v2/2000/40N_080W.tif"), MediaType.GEOTIFF),
+        (get_path("data/cog/v2/2000/40N_080W.tif"), MediaType.COG),
+    ],
+)  # type: ignore
+@pytest.mark.parametrize("strict", [False, True])  # type: ignore
+def test_get_media_type(asset_href: str, media_type: MediaType, strict: bool) -> None:
+    assert _get_media_type(asset_href, strict=strict) == media_type
+
+
+@pytest.mark.parametrize(
+    ["strict", "media_type"], [(False, MediaType.COG), (True, MediaType.GEOTIFF)]
+)  # type: ignore
+def test_get_media_type_tiled_with_overviews(
+    overview_geotiff_href: str, strict: bool, media_type: MediaType
+) -> None:
+    # tiles plus overviews pass the header check but not the full COG validation
+    assert _get_media_type(overview_geotiff_href, strict=strict) == media_type
+
+
+@pytest.mark.parametrize(
+    ["href_format", "href", "expected"],
+    [
+        (
+            "test/{version}/{year}/{loc}.tif",
+            "test/v2/2000/40N_080W.tif",
+            {"version": "v2", "year": "2000", "loc": "40N_080W"},
+        ),
+        ("test/{version}/{year}/{loc}.tif", "test/v2/2000/40N_080W.tiff", None),
+        (
+            "s3://b/{year}_{loc}.TIF",
+            "S3://b/2000_40N_080W.tif",
+            {"year": "2000", "loc": "40N_080W"},
+        ),
+        (
+            "a{{x}}/{year}/{loc}+(1).tif",
+            "a{x}/2000/l+(1).tif",
+            {"year": "2000", "loc": "l"},
+        ),
+        ("{year}/{loc}/{year}.tif", "2000/l/2000.tif", {"year": "2000", "loc": "l"}),
+        ("{year}/{loc}/{year}.tif", "2000/l/2001.tif", None),
+        ("{year:d}/{loc}.tif", "2000-2020change/l.tif", None),
+        (
+            "{version:l}{n}/{year}/{loc:w}.tif",
+            "v2/2000/40N_080W.tif",
+            {"version": "v", "n": "2", "year": "2000", "loc": "40N_080W"},
+        ),
+        ("{year}/{loc:w}.tif", "2000/40N-080W.tif", None),
+        (
+            "{year}/{loc:S}.tif",
+            "2000/40N-080W.tif",
+            {"year": "2000", "loc": "40N-080W"},
+        ),
+    ],
+)  # type: ignore
+def test_compile_href_format(
+    href_format: str, href: str, expected: Optional[Dict[str, str]]
+) -> None:
+    # matches hrefs like parse.parse(href_format, href)
+    match = _compile_href_format(href_format).fullmatch(href)
+    assert (match.groupdict() if match else None) == expected
+
+
+def test_compile_href_format_unsupported_type() -> None:
+    with pytest.raises(ValueError, match="Unsupported href_format field"):
+        _compile_href_format("test/{year}/{loc:x}.tif")
+
+
+def test_compile_href_format_cached() -> None:
+    href_format = "test/{version}/{year}/{loc}.tif"
+    _compile_href_format.cache_clear()
+    _compile_href_format(href_format)
+    _compile_href_format(href_format)
+    assert _compile_href_format.cache_info().hits == 1
+
+
+def test_registry_configs() -> None:
+    registry = CollectionRegistry()
+    assert set(registry.configs) == set(CollectionIDs)
+    for collection_id, config in registry.configs.items():
+        assert config is registry.get_config(collection_id)
+
+
+def test_registry_parse_href_upper_case_change() -> None:
+    registry = CollectionRegistry(href_format="x/{year}/{loc}.tif")
+    parsed = registry.parse_href("x/2000-2020CHANGE/l.tif")
+    assert parsed is not None
+    assert parsed["collection"] == CollectionIDs.GLAD_GLCLU2020_CHANGE.value
+    assert parsed["id"] == "2000-2020CHANGE_l"
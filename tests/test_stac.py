@@ -1,119 +1,172 @@
-from typing import Literal
+import itertools
+from pathlib import Path
+from typing import Callable, Dict, Literal, Tuple
 
 import pytest
-from pystac import MediaType
+from pystac import Collection, MediaType, STACObject
+from rasterio.errors import RasterioIOError
 
 from stactools.glad_glclu2020 import stac
 from stactools.glad_glclu2020.metadata import ASSET_NAME, CollectionIDs
 
-from . import test_data
+from . import get_path
+
+_FORMATS = (("geotiff", MediaType.GEOTIFF), ("cog", MediaType.COG))
+_YEARS = ("2000", "2000-2020change")
 
 
 @pytest.mark.parametrize(
     ["id", "media_type"],
     [
-        (CollectionIDs.GLAD_GLCLU2020, MediaType.GEOTIFF),
-        (CollectionIDs.GLAD_GLCLU2020, MediaType.COG),
-        (CollectionIDs.GLAD_GLCLU2020_CHANGE, MediaType.GEOTIFF),
-        (CollectionIDs.GLAD_GLCLU2020_CHANGE, MediaType.COG),
+        (id, media_type)
+        for id, (_, media_type) in itertools.product(CollectionIDs, _FORMATS)
     ],
 )  # type: ignore
 def test_create_collection_from_media_type(
+    collection_factory: Callable[..., Collection],
+    validate_once: Callable[[STACObject], None],
     id: Literal[CollectionIDs.GLAD_GLCLU2020, CollectionIDs.GLAD_GLCLU2020_CHANGE],
     media_type: MediaType,
 ) -> None:
     # This function should be updated to exercise the attributes of interest on
     # the collection
 
-    collection = stac.create_collection(id, media_type=media_type)
+    collection = collection_factory(id, media_type=media_type)
     collection.set_self_href(None)  # required for validation to pass
     assert collection.id == id
     assert collection.ext.item_assets[ASSET_NAME].media_type == media_type
-    collection.validate()
+    validate_once(collection)
 
 
 @pytest.mark.parametrize(
-    ["id", "sample_asset_href", "media_type"],
+    ["id", "format", "year", "media_type"],
     [
-        (
-            collection_id,
-            test_data.get_path(f"data/{format}/v2/{year}/40N_080W.tif"),
-            media_type,
+        (id, format, year, media_type)
+        for id, (format, media_type), year in itertools.product(
+            CollectionIDs, _FORMATS, _YEARS
         )
-        for collection_id in CollectionIDs
-        for format, media_type in [
-            ("geotiff", MediaType.GEOTIFF),
-            ("cog", MediaType.COG),
-        ]
-        for year in ["2000", "2000-2020change"]
     ],
 )  # type: ignore
 def test_create_collection_from_sample_asset_href(
+    collection_factory: Callable[..., Collection],
+    validate_once: Callable[[STACObject], None],
+    sample_asset_hrefs: Dict[Tuple[str, str], str],
     id: Literal[CollectionIDs.GLAD_GLCLU2020, CollectionIDs.GLAD_GLCLU2020_CHANGE],
-    sample_asset_href: str,
+    format: str,
+    year: str,
     media_type: MediaType,
 ) -> None:
     # This function should be updated to exercise the attributes of interest on
     # the collection
 
-    collection = stac.create_collection(id, sample_asset_href=sample_asset_href)
+    sample_asset_href = sample_asset_hrefs[format, year]
+    collection = collection_factory(id, sample_asset_href=sample_asset_href)
     collection.set_self_href(None)  # required for validation to pass
     assert collection.id == id
-    print("asset media_type:", collection.ext.item_assets[ASSET_NAME].media_type)
-    print("expected media_type:", media_type)
     assert collection.ext.item_assets[ASSET_NAME].media_type == media_type
-    collection.validate()
+    validate_once(collection)
 
 
 @pytest.mark.parametrize(
-    ["asset_href", "year", "media_type"],
+    ["format", "year", "media_type", "href_format"],
     [
-        (
-            test_data.get_path(f"data/{format}/v2/{year}/40N_080W.tif"),
-            year,
-            media_type,
-        )
-        for format, media_type in [
-            ("geotiff", MediaType.GEOTIFF),
-            ("cog", MediaType.COG),
-        ]
-        for year in ["2000", "2000-2020change"]
+        (format, year, media_type, f"data/{format}/{{version}}/{{year}}/{{loc}}.tif")
+        for (format, media_type), year in itertools.product(_FORMATS, _YEARS)
     ],
 )  # type: ignore
-def test_create_item(asset_href: str, year: str, media_type: MediaType) -> None:
+def test_create_item(
+    collection_factory: Callable[..., Collection],
+    sample_assets_root: Path,
+    sample_asset_hrefs: Dict[Tuple[str, str], str],
+    format: str,
+    year: str,
+    media_type: MediaType,
+    href_format: str,
+) -> None:
+    asset_href = sample_asset_hrefs[format, year]
     version, loc = "v2", "40N_080W"
-    test_href_format = (
-        asset_href.replace(version, "{version}")
-        .replace(year, "{year}")
-        .replace(loc, "{loc}")
-    )
 
     item = stac.create_item(
-        test_data.get_path(asset_href), href_format=test_href_format
+        asset_href, href_format=str(sample_assets_root / href_format)
     )
     assert item.id == "_".join([version, year, loc])
     assert item.assets[ASSET_NAME].media_type == media_type
+
+    collection_id = (
+        CollectionIDs.GLAD_GLCLU2020_CHANGE
+        if "change" in year
+        else CollectionIDs.GLAD_GLCLU2020
+    )
+    assert item.collection_id == collection_id
+    collection = collection_factory(collection_id, media_type=media_type)
+    assert item.assets[ASSET_NAME].title == collection.ext.item_assets[ASSET_NAME].title
     item.validate()
 
 
-def test_bad_item_href_formats() -> None:
+def test_create_items() -> None:
+    asset_hrefs = [get_path(f"data/cog/v2/{year}/40N_080W.tif") for year in _YEARS]
+    href_format = get_path("data/cog/{version}/{year}/{loc}.tif")
+
+    items = list(stac.create_items(asset_hrefs, href_format=href_format))
+    assert [item.id for item in items] == [
+        "v2_2000_40N_080W",
+        "v2_2000-2020change_40N_080W",
+    ]
+    for item in items:
+        item.validate()
+
+
+def test_create_items_failed_item() -> None:
+    asset_hrefs = [
+        get_path("data/cog/v2/2000/40N_080W.tif"),
+        get_path("data/cog/v2/2000/missing.tif"),
+        get_path("data/cog/v2/2000-2020change/40N_080W.tif"),
+    ]
+    href_format = get_path("data/cog/{version}/{year}/{loc}.tif")
+
+    items = stac.create_items(asset_hrefs, href_format=href_format)
+    assert next(items).id == "v2_2000_40N_080W"
+    with pytest.raises(RasterioIOError):
+        next(items)
+
+
+def test_create_items_bad_href_format() -> None:
+    # raised when called, before the items are iterated
+    with pytest.raises(ValueError, match="Unsupported href_format field"):
+        stac.create_items(["test/v2/2000/10N_050W.tif"], "test/{year}/{loc:x}.tif")
+
+
+BAD_CASES = [
+    (
+        "test.tif",
+        "test/{version}/{yeer}/{loc}.tif",
+        "missing required parameters: year",
+    ),
+    (
+        "test/v2/20000/10N_050W.tif",
+        "test/{version}/{year}/{loc}.tif",
+        "The year parameter cannot be parsed",
+    ),
+    (
+        "test/v2/2000-20200change/10N_050W.tif",
+        "test/{version}/{year}/{loc}.tif",
+        "The year parameter cannot be parsed",
+    ),
+    (
+        "test/v2/\u0662\u0660\u0660\u0660/10N_050W.tif",
+        "test/{version}/{year}/{loc}.tif",
+        "The year parameter cannot be parsed",
+    ),
+    (
+        "10N_050W.tif",
+        "test/{version}/{year}/{loc}.tif",
+        "could not parse the provided href",
+    ),
+]
+
+
+@pytest.mark.parametrize(["href", "href_format", "message"], BAD_CASES)  # type: ignore
+def test_bad_item_href_formats(href: str, href_format: str, message: str) -> None:
     """Test bad hrefs and href_formats"""
-    with pytest.raises(ValueError, match="missing required parameters: year"):
-        stac.create_item("test.tif", href_format="test/{version}/{yeer}/{loc}.tif")
-
-    with pytest.raises(ValueError, match="The year parameter cannot be parsed"):
-        stac.create_item(
-            "test/v2/20000/10N_050W.tif", href_format="test/{version}/{year}/{loc}.tif"
-        )
-
-    with pytest.raises(ValueError, match="The year parameter cannot be parsed"):
-        stac.create_item(
-            "test/v2/2000-20200change/10N_050W.tif",
-            href_format="test/{version}/{year}/{loc}.tif",
-        )
-
-    with pytest.raises(ValueError, match="could not parse the provided href"):
-        stac.create_item(
-            "10N_050W.tif",
-            href_format="test/{version}/{year}/{loc}.tif",
-        )
+    with pytest.raises(ValueError, match=message):
+        stac.create_item(href, href_format=href_format)